@@ -327,7 +327,7 @@ def cmd_encrypt(args: argparse.Namespace) -> None:
     if ".." in Path(output).parts:
         print("Error: Output path must not contain '..' (path traversal)", file=sys.stderr)
         sys.exit(1)
-    encrypted = encrypt_document(doc, password)
+    encrypted = encrypt_document(doc, password, kdf=getattr(args, "kdf", "pbkdf2"))
     Path(output).write_bytes(encrypted)
     print(f"Encrypted {args.path} -> {output} ({len(encrypted)} bytes)")
 
@@ -397,7 +397,7 @@ def cmd_verify(args: argparse.Namespace) -> None:
     from pfm.reader import PFMReader
     from pfm.security import verify
 
-    doc = PFMReader.read(args.path)
+    doc = PFMReader.read(args.path, keep_utf8=True)
     secret = args.secret
     if not secret:
         import getpass
@@ -491,7 +491,7 @@ def cmd_prior_incantato(args: argparse.Namespace) -> None:
     from pfm.reader import PFMReader
     from pfm.spells import prior_incantato
 
-    doc = PFMReader.read(args.path)
+    doc = PFMReader.read(args.path, keep_utf8=True)
     result = prior_incantato(doc)
 
     print(f"Prior Incantato: {args.path}\n")
@@ -629,6 +629,8 @@ def main() -> None:
     p_encrypt.add_argument("path", help="Path to .pfm file")
     p_encrypt.add_argument("-p", "--password", help="Encryption password (prompted if omitted)")
     p_encrypt.add_argument("-o", "--output", help="Output path (default: <path>.enc)")
+    p_encrypt.add_argument("--kdf", choices=["pbkdf2", "scrypt"], default="pbkdf2",
+                           help="Key derivation (default: pbkdf2; scrypt writes PFM-ENC/2.0)")
 
     # decrypt
     p_decrypt = sub.add_parser("decrypt", help="Decrypt an encrypted .pfm file")
@@ -670,6 +672,8 @@ def main() -> None:
     p_fidelius.add_argument("path", help="Path to .pfm file")
     p_fidelius.add_argument("-p", "--password", help="Encryption password (prompted if omitted)")
     p_fidelius.add_argument("-o", "--output", help="Output path (default: <path>.enc)")
+    p_fidelius.add_argument("--kdf", choices=["pbkdf2", "scrypt"], default="pbkdf2",
+                           help="Key derivation (default: pbkdf2; scrypt writes PFM-ENC/2.0)")
 
     # revelio (alias for decrypt)
     p_revelio = sub.add_parser("revelio", help="Decrypt an encrypted .pfm file")
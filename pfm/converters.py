@@ -276,8 +276,8 @@ def from_markdown(md_str: str) -> PFMDocument:
         i = 1
         while i < len(lines) and lines[i].strip() != "---":
             line = lines[i].strip()
-            if ": " in line:
-                key, val = line.split(": ", 1)
+            key, sep, val = line.partition(": ")
+            if sep:
                 key = key.strip()
                 val = val.strip()
                 if key in META_ALLOWLIST:
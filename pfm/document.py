@@ -5,16 +5,26 @@ PFM Document - In-memory representation of a .pfm file.
 from __future__ import annotations
 
 import hashlib
+import sys
 import uuid
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
+from itertools import islice
+from operator import attrgetter
 
 from pfm.spec import (
     MAX_SECTIONS,
     MAX_SECTION_NAME_LENGTH,
-    ALLOWED_SECTION_NAME_CHARS,
+    SECTION_NAME_RE,
 )
 
+# Pre-initialized SHA-256 state; .copy() skips the per-hash EVP setup.
+# Shared with pfm.reader and pfm.writer. Only ever .copy() it: an update()
+# on the prototype would corrupt every checksum computed afterwards.
+_SHA256_PROTO = hashlib.sha256()
+
+_section_name = attrgetter("name")
+
 
 @dataclass
 class PFMSection:
@@ -23,6 +33,28 @@ class PFMSection:
     content: str
     offset: int = 0   # byte offset from file start (populated on read/write)
     length: int = 0    # byte length of content (populated on read/write)
+    # UTF-8 encoding of content, filled on first use (see content_bytes)
+    _content_utf8: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        # Replacing the content invalidates the cached encoding
+        if name == "content":
+            object.__setattr__(self, "_content_utf8", None)
+        object.__setattr__(self, name, value)
+
+    def seed_content_bytes(self, data: bytes) -> None:
+        """Supply content's UTF-8 encoding when the caller already holds it
+        (e.g. the raw body the reader decoded content from)."""
+        object.__setattr__(self, "_content_utf8", data)
+
+    @property
+    def content_bytes(self) -> bytes:
+        """Content encoded as UTF-8. Encoded once, reused until content changes."""
+        data = self._content_utf8
+        if data is None:
+            data = self.content.encode("utf-8")
+            object.__setattr__(self, "_content_utf8", data)
+        return data
 
 
 @dataclass
@@ -56,6 +88,14 @@ class PFMDocument:
     # Format version
     format_version: str = "1.0"
 
+    # Name -> positions in sections, kept current by add_section. Rebuilt
+    # if the sections list was replaced or resized directly; get_section
+    # falls back to a scan when in-place edits left it stale.
+    _by_name: dict[str, list[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed: tuple[list[PFMSection] | None, int] = field(
+        default=(None, 0), init=False, repr=False, compare=False
+    )
+
     @classmethod
     def create(
         cls,
@@ -95,7 +135,7 @@ class PFMDocument:
                 f"Section name too long: {len(name)} chars "
                 f"(max {MAX_SECTION_NAME_LENGTH})"
             )
-        if not all(c in ALLOWED_SECTION_NAME_CHARS for c in name):
+        if not SECTION_NAME_RE.fullmatch(name):
             raise ValueError(
                 f"Invalid section name: {name!r}. "
                 f"Only lowercase alphanumeric, hyphens, and underscores allowed."
@@ -109,15 +149,43 @@ class PFMDocument:
                 f"Maximum section count exceeded: {MAX_SECTIONS}"
             )
 
-        section = PFMSection(name=name, content=content)
+        # Names repeat across sections and documents; intern for cheap compares
+        section = PFMSection(name=sys.intern(name), content=content)
+        by_name = self._name_index()
+        by_name.setdefault(section.name, []).append(len(self.sections))
         self.sections.append(section)
+        self._indexed = (self.sections, len(self.sections))
         return section
 
+    def _name_index(self) -> dict[str, list[int]]:
+        """Return the name index, rebuilding it if sections changed behind it."""
+        sections = self.sections
+        indexed, count = self._indexed
+        if indexed is not sections or count != len(sections):
+            by_name: dict[str, list[int]] = {}
+            for i, s in enumerate(sections):
+                by_name.setdefault(s.name, []).append(i)
+            self._by_name = by_name
+            self._indexed = (sections, len(sections))
+        return self._by_name
+
     def get_section(self, name: str) -> PFMSection | None:
-        """Get first section by name. O(n) scan - use reader for O(1) indexed access."""
-        for s in self.sections:
-            if s.name == name:
-                return s
+        """Get first section by name, located via the name index."""
+        positions = self._name_index().get(name)
+        sections = self.sections
+        if positions:
+            first = positions[0]
+            section = sections[first]
+            # In-place edits may have given an earlier section this name; the
+            # C-level prefix check keeps the answer "first by name"
+            if section.name == name and name not in map(_section_name, islice(sections, first)):
+                return section
+        # Miss or stale hit: sections may have been replaced or renamed in
+        # place. Scan, and reindex if the index was out of date.
+        for section in sections:
+            if section.name == name:
+                self._indexed = (None, 0)
+                return section
         return None
 
     def get_sections(self, name: str) -> list[PFMSection]:
@@ -126,9 +194,9 @@ class PFMDocument:
 
     def compute_checksum(self) -> str:
         """Compute SHA-256 checksum of all section contents combined."""
-        h = hashlib.sha256()
+        h = _SHA256_PROTO.copy()
         for section in self.sections:
-            h.update(section.content.encode("utf-8"))
+            h.update(section.content_bytes)
         return h.hexdigest()
 
     def get_meta_dict(self) -> dict[str, str]:
@@ -2,9 +2,12 @@
 PFM Reader - Fast parser for .pfm files.
 
 Speed features:
+  - Full parse scans raw bytes for markers — no per-line str objects
+  - Large files are parsed in 64 KB chunks (PFMReader.stream) — peak memory
+    tracks the largest section, not the file
   - Magic byte check in first 64 bytes (instant file identification)
-  - Index-based O(1) section access via file seek (true lazy reading)
-  - Only the header (magic + meta + index) is read on open
+  - Index-based O(1) section access via mmap slicing (true lazy reading)
+  - Only the header (magic + meta + index) is parsed on open
   - Section content is read on demand — never loads the full file into memory
 
 Security features:
@@ -12,22 +15,214 @@ Security features:
   - Strict allowlist for meta field parsing (no arbitrary setattr)
   - File size limits (prevents OOM from crafted files)
   - Index bounds validation (prevents out-of-bounds reads)
+
+Shared with pfm.stream (crash recovery):
+  - iter_marker_lines() — the byte-level marker scanner, yielding
+    (start, end, kind) with kind MAGIC_LINE, EOF_LINE or None (section)
 """
 
 from __future__ import annotations
 
 import builtins
-import hashlib
 import hmac as _hmac
+import mmap
+import os
+import re
+import stat
+from collections import OrderedDict
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Callable, Iterator
 
 from pfm.spec import (
     MAGIC, EOF_MARKER, SECTION_PREFIX, MAX_MAGIC_SCAN_BYTES,
     META_ALLOWLIST, MAX_FILE_SIZE, MAX_META_FIELDS, SUPPORTED_FORMAT_VERSIONS,
     unescape_content,
 )
-from pfm.document import PFMDocument, PFMSection
+from pfm.document import PFMDocument, PFMSection, _SHA256_PROTO
+
+# Byte forms of the markers, for scanning raw file data without decoding
+MAGIC_BYTES = MAGIC.encode("ascii")
+EOF_BYTES = EOF_MARKER.encode("ascii")
+SECTION_PREFIX_BYTES = SECTION_PREFIX.encode("ascii")
+_MARKER_LEN = max(len(MAGIC_BYTES), len(EOF_BYTES), len(SECTION_PREFIX_BYTES))
+_SECTION_PREFIX_LEN = len(SECTION_PREFIX_BYTES)
+
+# Structural sections: parsed into meta/index, never added as content
+_NON_CONTENT_SECTIONS = frozenset({"meta", "index", "index-trailing"})
+_INDEX_SECTIONS = frozenset({"index", "index-trailing"})
+
+# One compiled pattern classifies a candidate marker line and finds its end.
+# match.lastindex tells the kind: MAGIC_LINE, EOF_LINE, or None (section).
+_MARKER_RE = re.compile(
+    b"(?:(" + re.escape(MAGIC_BYTES) + b")|(" + re.escape(EOF_BYTES) + b")|"
+    + re.escape(SECTION_PREFIX_BYTES) + b")[^\n]*"
+)
+MAGIC_LINE = 1
+EOF_LINE = 2
+
+# Streaming parse: read() switches to chunked scanning above this size
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_READ_THRESHOLD = 8 * 1024 * 1024
+
+# Decoded sections kept per open handle (LRU, bounded so big files don't pin)
+SECTION_CACHE_SIZE = 16
+
+
+def iter_marker_lines(data: bytes) -> Iterator[tuple[int, int, int | None]]:
+    """Yield (start, end, kind) for every line that starts with a PFM marker.
+
+    ``start`` is the offset of the marker, ``end`` the offset of the
+    terminating newline (or len(data) for an unterminated last line), and
+    ``kind`` is MAGIC_LINE, EOF_LINE or None for a section header.
+    Only lines beginning with '#' are inspected — everything else is
+    skipped by a single C-level ``find`` per candidate.
+    """
+    n = len(data)
+    match = _MARKER_RE.match
+    pos = 0
+    while pos < n:
+        m = match(data, pos)
+        if m is not None:
+            yield pos, m.end(), m.lastindex
+        nxt = data.find(b"\n#", pos)
+        if nxt < 0:
+            return
+        pos = nxt + 1
+
+
+def _join_pieces(
+    data: bytes, pieces: list[tuple[int, int]], strip_padding: bool = False
+) -> bytes:
+    """Assemble a section body from its line ranges.
+
+    With ``strip_padding``, one trailing newline is removed (the writer's
+    padding that leaks into the last section of an unfinalized file).
+    """
+    if len(pieces) == 1:
+        s, e = pieces[0]
+        if strip_padding and e > s and data[e - 1] == 0x0A:
+            e -= 1
+        return data[s:e]
+    body = b"\n".join([data[s:e] for s, e in pieces])
+    if strip_padding and body[-1:] == b"\n":
+        body = body[:-1]
+    return body
+
+
+def _stream_sections(path: Path, chunk_size: int) -> Iterator[tuple[str | None, bytes]]:
+    """Incrementally scan a file for sections, ``chunk_size`` bytes at a time.
+
+    Yields ``(name, body)`` per section exactly as ``PFMReader.parse`` would
+    assemble it, and ``(None, line)`` for each magic line. Only the current
+    section is buffered: content already scanned is moved out of the
+    rolling buffer so it never grows beyond one chunk plus a partial line.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        buf = bytearray()
+        current_section: str | None = None
+        pieces: list[bytes] = []   # Completed line ranges of the current section
+        carry: list[bytes] = []    # Scanned-but-unfinished range of the current section
+        body_start = 0             # Start of the unfinished range within buf
+        search_from = 0            # Everything before this has been scanned
+        candidate: int | None = 0  # Line start to classify (file start is a line start)
+        pending_cr = False
+        at_eof = False
+        hit_eof_marker = False
+
+        while not hit_eof_marker:
+            # --- Refill: read a chunk, normalizing CRLF/CR across boundaries ---
+            chunk = os.read(fd, chunk_size)
+            at_eof = not chunk
+            if pending_cr:
+                chunk = b"\r" + chunk
+                pending_cr = False
+            if not at_eof and chunk[-1:] == b"\r":
+                chunk = chunk[:-1]
+                pending_cr = True
+            if b"\r" in chunk:
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            buf += chunk
+
+            # --- Scan every marker line that is complete in the buffer ---
+            while True:
+                if candidate is None:
+                    i = buf.find(b"\n#", search_from)
+                    if i < 0:
+                        search_from = max(search_from, len(buf) - 1)
+                        break
+                    candidate = i + 1
+                start = candidate
+                if len(buf) - start < _MARKER_LEN and not at_eof:
+                    break  # Need more bytes to classify this line
+                m = _MARKER_RE.match(buf, start)
+                if m is None:
+                    search_from = start
+                    candidate = None
+                    continue
+                end = m.end()
+                if end == len(buf) and not at_eof:
+                    break  # Marker line not complete yet
+                kind = m.lastindex
+                candidate = None
+                search_from = end
+
+                if current_section is not None and (carry or start > body_start):
+                    carry.append(bytes(buf[body_start:start - 1]))
+                    pieces.append(b"".join(carry))
+                    carry = []
+                body_start = end + 1
+
+                if kind == MAGIC_LINE:
+                    yield None, bytes(buf[start:end])
+                    continue
+                if kind == EOF_LINE:
+                    hit_eof_marker = True
+                    break
+                if current_section is not None:
+                    yield current_section, b"\n".join(pieces)
+                # A bare "#@" header names no section; its lines are dropped
+                current_section = bytes(buf[start + _SECTION_PREFIX_LEN:end]).decode("utf-8") or None
+                pieces = []
+
+            if hit_eof_marker or at_eof:
+                break
+
+            # --- Compact: move scanned content out of the rolling buffer ---
+            keep = search_from
+            if current_section is not None and body_start < keep:
+                carry.append(bytes(buf[body_start:keep]))
+                body_start = keep
+            del buf[:keep]
+            body_start -= keep
+            search_from = 0
+            if candidate is not None:
+                candidate -= keep
+
+        # Flush last section
+        if current_section is not None:
+            if not hit_eof_marker and (carry or body_start <= len(buf)):
+                # No EOF marker — the last section runs to the end of the data
+                carry.append(bytes(buf[body_start:]))
+                pieces.append(b"".join(carry))
+            body = b"\n".join(pieces)
+            if not hit_eof_marker and body[-1:] == b"\n":
+                body = body[:-1]
+            yield current_section, body
+    finally:
+        os.close(fd)
+
+
+def _parse_magic_version(line: str) -> str:
+    """Extract and validate the format version from a magic line."""
+    version_part = line.split("/", 1)[1] if "/" in line else "1.0"
+    parsed_version = version_part.split(":")[0]  # Strip :STREAM flag
+    if parsed_version not in SUPPORTED_FORMAT_VERSIONS:
+        raise ValueError(
+            f"Unsupported PFM format version: {parsed_version!r}. "
+            f"Supported: {', '.join(sorted(SUPPORTED_FORMAT_VERSIONS))}"
+        )
+    return parsed_version
 
 
 class PFMIndex:
@@ -65,7 +260,7 @@ class PFMReader:
         # Full parse (loads entire file)
         doc = PFMReader.read("file.pfm")
 
-        # Indexed access (lazy — only reads header on open, seeks for sections)
+        # Indexed access (lazy — only reads header on open, slices sections from a memory map)
         with PFMReader.open("file.pfm") as reader:
             content = reader.get_section("content")
     """
@@ -80,19 +275,83 @@ class PFMReader:
 
     @staticmethod
     def is_pfm(path: str | Path) -> bool:
-        """Fast check if a file is PFM format. Reads only first 64 bytes."""
-        with open(path, "rb") as f:
-            head = f.read(MAX_MAGIC_SCAN_BYTES)
-        return head.startswith(MAGIC.encode("utf-8"))
+        """Fast check if a file is PFM format. Reads only first 64 bytes.
+
+        Uses a raw file descriptor — no buffered file object is created,
+        which matters when scanning large directories.
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            head = os.read(fd, MAX_MAGIC_SCAN_BYTES)
+        finally:
+            os.close(fd)
+        return head.startswith(MAGIC_BYTES)
 
     @staticmethod
     def is_pfm_bytes(data: bytes) -> bool:
         """Fast check if bytes are PFM format."""
-        return data[:len(MAGIC)].startswith(MAGIC.encode("utf-8"))
+        return data.startswith(MAGIC_BYTES)
+
+    @classmethod
+    def read(
+        cls, path: str | Path, max_size: int = MAX_FILE_SIZE, *, keep_utf8: bool = False
+    ) -> PFMDocument:
+        """Fully parse a .pfm file into a PFMDocument.
+
+        Files are memory-mapped and parsed in place; files larger than
+        STREAM_READ_THRESHOLD are scanned in chunks instead. See parse()
+        for keep_utf8.
+        """
+        path = Path(path)
+        st = path.stat()
+        file_size = st.st_size
+        if file_size > max_size:
+            raise ValueError(
+                f"File size {file_size} exceeds maximum {max_size} bytes. "
+                f"Pass max_size= to override."
+            )
+        if not stat.S_ISREG(st.st_mode):
+            # Pipes, FIFOs and devices report no usable size and can't be
+            # mapped: read what they produce (parse enforces max_size)
+            with open(path, "rb") as f:
+                data = f.read(max_size + 1)
+            return cls.parse(data, max_size=max_size, keep_utf8=keep_utf8)
+        if file_size > STREAM_READ_THRESHOLD:
+            # Large file: build the document section by section instead of
+            # holding the raw bytes and the decoded document at the same time
+            doc = PFMDocument()
+            for name, body in _stream_sections(path, STREAM_CHUNK_SIZE):
+                if name is None:
+                    doc.format_version = _parse_magic_version(body.decode("utf-8"))
+                else:
+                    cls._add_section_body(doc, name, body, keep_utf8)
+            return doc
+        if not file_size:
+            return cls.parse(b"", keep_utf8=keep_utf8)
+        # Parse straight out of a read-only map: each section body is sliced
+        # and decoded once, with no full-file copy in the Python heap. The
+        # map is closed before returning, so the document never pins the file.
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b"\r") >= 0:
+                return cls.parse(mapped[:], keep_utf8=keep_utf8)  # CRLF normalization needs bytes
+            return cls.parse(mapped, keep_utf8=keep_utf8)
 
     @classmethod
-    def read(cls, path: str | Path, max_size: int = MAX_FILE_SIZE) -> PFMDocument:
-        """Fully parse a .pfm file into a PFMDocument."""
+    def stream(
+        cls,
+        path: str | Path,
+        max_size: int = MAX_FILE_SIZE,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[tuple[str, bytes]]:
+        """Iterate over the sections of a .pfm file without loading it whole.
+
+        Reads the file in ``chunk_size`` pieces and yields ``(name, body)``
+        for every section in file order — including ``meta`` and index
+        sections. ``body`` is the raw UTF-8 section body as stored on disk:
+        the writer's trailing newline is removed, but content escaping is
+        not (use ``unescape_content(body.decode("utf-8"))``). Peak memory
+        is proportional to the largest section, not the file.
+        """
         path = Path(path)
         file_size = path.stat().st_size
         if file_size > max_size:
@@ -100,126 +359,131 @@ class PFMReader:
                 f"File size {file_size} exceeds maximum {max_size} bytes. "
                 f"Pass max_size= to override."
             )
-        with open(path, "rb") as f:
-            data = f.read()
-        return cls.parse(data)
+        for name, body in _stream_sections(path, chunk_size):
+            if name is None:
+                _parse_magic_version(body.decode("utf-8"))  # Reject unknown versions
+            else:
+                yield name, body
 
     @classmethod
-    def parse(cls, data: bytes, max_size: int = MAX_FILE_SIZE) -> PFMDocument:
-        """Parse bytes into a PFMDocument."""
+    def parse(
+        cls, data: bytes, max_size: int = MAX_FILE_SIZE, *, keep_utf8: bool = False
+    ) -> PFMDocument:
+        """Parse bytes into a PFMDocument.
+
+        Works directly on the raw bytes: section boundaries are located with
+        ``bytes.find`` and each section body is sliced and decoded exactly
+        once. Content lines are never split into individual str objects.
+
+        With ``keep_utf8``, sections that needed no unescaping also keep
+        their raw body as content_bytes, so an immediate checksum or
+        signature check skips re-encoding — at the cost of holding each
+        section twice (str and bytes).
+        """
         if len(data) > max_size:
             raise ValueError(
                 f"Input size {len(data)} exceeds maximum {max_size} bytes. "
                 f"Pass max_size= to override."
             )
-        text = data.decode("utf-8")
         # Normalize CRLF/CR to LF to handle Windows line endings
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-        lines = text.split("\n")
+        if data.find(b"\r") >= 0:
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
         doc = PFMDocument()
         current_section: str | None = None
-        section_lines: list[str] = []
-        in_meta = False
-        in_index = False
+        # Byte ranges of the current section's lines (newline-separated,
+        # without the final newline). Usually a single range; a stray magic
+        # line inside a section splits it in two.
+        pieces: list[tuple[int, int]] = []
+        body_start = 0
         hit_eof = False
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        for start, end, kind in iter_marker_lines(data):
+            if current_section is not None and start > body_start:
+                pieces.append((body_start, start - 1))
+            body_start = end + 1
 
             # Magic line (handles both "#!PFM/1.0" and "#!PFM/1.0:STREAM")
-            if line.startswith(MAGIC):
-                version_part = line.split("/", 1)[1] if "/" in line else "1.0"
-                parsed_version = version_part.split(":")[0]  # Strip :STREAM flag
-                if parsed_version not in SUPPORTED_FORMAT_VERSIONS:
-                    raise ValueError(
-                        f"Unsupported PFM format version: {parsed_version!r}. "
-                        f"Supported: {', '.join(sorted(SUPPORTED_FORMAT_VERSIONS))}"
-                    )
-                doc.format_version = parsed_version
-                i += 1
+            if kind == MAGIC_LINE:
+                doc.format_version = _parse_magic_version(data[start:end].decode("utf-8"))
                 continue
 
             # EOF marker (only match unescaped)
-            if line.startswith(EOF_MARKER):
+            if kind == EOF_LINE:
                 hit_eof = True
                 break
 
             # Section header (only match unescaped — escaped lines start with \#)
-            if line.startswith(SECTION_PREFIX):
-                # Flush previous section
-                skip_sections = ("meta", "index", "index-trailing")
-                if current_section and current_section not in skip_sections:
-                    content = "\n".join(section_lines)
-                    # Unescape content lines
-                    content = unescape_content(content)
-                    doc.add_section(current_section, content)
-
-                section_name = line[len(SECTION_PREFIX):]
-                current_section = section_name
-                section_lines = []
-                in_meta = section_name == "meta"
-                in_index = section_name in ("index", "index-trailing")
-                i += 1
-                continue
-
-            # Meta key-value pairs (strict allowlist — PFM-002 fix)
-            if in_meta:
-                if ": " in line:
-                    key, val = line.split(": ", 1)
-                    key = key.strip()
-                    val = val.strip()
-                    if key in META_ALLOWLIST:
-                        # First-wins: prevent duplicate meta key override
-                        # Use explicit dict-style access to avoid setattr risks
-                        if not getattr(doc, key, ""):
-                            doc.__dict__[key] = val
-                    else:
-                        # First-wins: only set if key not already present
-                        if key not in doc.custom_meta:
-                            # PFM-014: Enforce custom meta field count limit
-                            if len(doc.custom_meta) >= MAX_META_FIELDS:
-                                raise ValueError(
-                                    f"Maximum custom meta fields exceeded: {MAX_META_FIELDS}"
-                                )
-                            doc.custom_meta[key] = val
-                i += 1
-                continue
-
-            # Index entries (skipped in full parse — index is only used for lazy access)
-            if in_index:
-                i += 1
-                continue
-
-            # Section content (raw — unescaping happens on flush)
-            if current_section:
-                section_lines.append(line)
-
-            i += 1
+            if current_section is not None:
+                cls._add_section_body(doc, current_section, _join_pieces(data, pieces), keep_utf8)
+            # A bare "#@" header names no section; its lines are dropped
+            current_section = data[start + _SECTION_PREFIX_LEN:end].decode("utf-8") or None
+            pieces = []
 
         # Flush last section
-        if current_section and current_section not in ("meta", "index", "index-trailing"):
-            content = "\n".join(section_lines)
+        if current_section is not None:
+            if not hit_eof and body_start <= len(data):
+                # No EOF marker — the last section runs to the end of the data
+                pieces.append((body_start, len(data)))
             # Strip trailing newline only for unfinalized stream files (no EOF marker).
             # The writer adds \n after content for format correctness. In finalized
             # files, the EOF marker stops accumulation before this padding, so
             # content trailing newlines are preserved. In unfinalized files (crash
             # recovery), the padding \n leaks into the last section's content.
-            if not hit_eof and content.endswith("\n"):
-                content = content[:-1]
-            content = unescape_content(content)
-            doc.add_section(current_section, content)
+            body = _join_pieces(data, pieces, strip_padding=not hit_eof)
+            cls._add_section_body(doc, current_section, body, keep_utf8)
 
         return doc
 
+    @staticmethod
+    def _add_section_body(
+        doc: PFMDocument, name: str, body: bytes, keep_utf8: bool = False
+    ) -> None:
+        """Decode one section body and add it to the document (or its meta)."""
+        # Index entries are skipped in full parse — index is only used for lazy access
+        if name in _INDEX_SECTIONS:
+            return
+
+        if name != "meta":
+            # Unescape content lines
+            text = body.decode("utf-8")
+            content = unescape_content(text)
+            section = doc.add_section(name, content)
+            if keep_utf8 and len(content) == len(text):
+                # Nothing was unescaped, so the raw body already is the
+                # UTF-8 encoding of content
+                section.seed_content_bytes(bytes(body))
+            return
+
+        # Meta key-value pairs (strict allowlist — PFM-002 fix)
+        for line in body.decode("utf-8").split("\n"):
+            key, sep, val = line.partition(": ")
+            if not sep:
+                continue
+            key = key.strip()
+            val = val.strip()
+            if key in META_ALLOWLIST:
+                # First-wins: prevent duplicate meta key override
+                # Use explicit dict-style access to avoid setattr risks
+                if not getattr(doc, key, ""):
+                    doc.__dict__[key] = val
+            else:
+                # First-wins: only set if key not already present
+                if key not in doc.custom_meta:
+                    # PFM-014: Enforce custom meta field count limit
+                    if len(doc.custom_meta) >= MAX_META_FIELDS:
+                        raise ValueError(
+                            f"Maximum custom meta fields exceeded: {MAX_META_FIELDS}"
+                        )
+                    doc.custom_meta[key] = val
+
     @classmethod
     def open(cls, path: str | Path, max_size: int = MAX_FILE_SIZE) -> PFMReaderHandle:
         """Open a .pfm file for indexed, lazy reading.
 
-        Only reads the header (magic + meta + index) on open.
-        Section content is read on demand via file seek — the full file
-        is never loaded into memory.
+        Only parses the header (magic + meta + index) on open. The file is
+        memory-mapped, so section content is paged in on demand — the full
+        file is never copied into the Python heap.
 
         CRLF safety: If the file contains ``\\r\\n`` line endings (e.g. from
         Git autocrlf on Windows), the reader transparently normalizes the
@@ -234,25 +498,29 @@ class PFMReader:
             )
 
         f = builtins_open(path, "rb")
-        # Detect CRLF: peek at first 4 KB to check for \r\n
-        head = f.read(min(file_size, 4096))
-        has_crlf = b"\r\n" in head
-
-        if has_crlf:
-            # Normalize entire file to LF in memory so index offsets work
-            f.seek(0)
-            raw = f.read()
-            f.close()
-            normalized = raw.replace(b"\r\n", b"\n")
-            import io as _io
-            f = _io.BytesIO(normalized)
-            file_size = len(normalized)
-
-        else:
-            f.seek(0)
+        try:
+            # Map the file read-only: slicing the map touches only the pages
+            # a section occupies, so opening a large file costs almost nothing.
+            raw: bytes | mmap.mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size else b""
+            )
 
-        reader = PFMReaderHandle(f, file_size)
-        reader._parse_header()
+            # Detect CRLF: peek at first 4 KB to check for \r\n
+            if raw.find(b"\r\n", 0, 4096) >= 0:
+                # Normalize entire file to LF in memory so index offsets work
+                normalized = raw[:].replace(b"\r\n", b"\n")
+                raw.close()
+                raw = normalized
+        except BaseException:
+            f.close()
+            raise
+
+        reader = PFMReaderHandle(f, raw)
+        try:
+            reader._parse_header()
+        except BaseException:
+            reader.close()
+            raise
         return reader
 
 
@@ -265,142 +533,178 @@ class PFMReaderHandle:
     Handle for indexed, lazy access to a .pfm file.
 
     Only the header (magic, meta, index) is parsed on open.
-    Section content is read on demand via file seek — O(1) per section,
-    with no upfront cost proportional to file size.
+    Section content is sliced out of a read-only memory map on demand —
+    O(1) per section, with no upfront cost proportional to file size.
     """
 
-    def __init__(self, handle: BinaryIO, file_size: int) -> None:
+    def __init__(self, handle: BinaryIO, raw: bytes | mmap.mmap) -> None:
         self._handle = handle
-        self._file_size = file_size
+        self._raw = raw  # mmap of the file (or normalized bytes for CRLF files)
+        self._file_size = len(raw)
         self.meta: dict[str, str] = {}
         self.index: PFMIndex = PFMIndex()
         self.format_version: str = ""
+        self._section_cache: OrderedDict[str, str] = OrderedDict()
 
     def _parse_header(self) -> None:
-        """Parse only magic, meta, and index by reading line-by-line.
+        """Parse only magic, meta, and index from the start of the map.
 
-        Stops as soon as the first content section header is encountered.
-        Handles both inline index (standard) and trailing index (stream mode).
+        Marker lines are located with a byte scan; only the meta and index
+        regions are decoded. Stops as soon as the first content section
+        header is encountered, so the pages holding content are never
+        touched. Handles both inline index (standard) and trailing index
+        (stream mode).
         """
-        self._handle.seek(0)
+        raw = self._raw
         current_section: str | None = None
+        region_start = 0
         is_stream = False
 
-        while True:
-            line_bytes = self._handle.readline()
-            if not line_bytes:
-                break
-            line = line_bytes.decode("utf-8").rstrip("\n").rstrip("\r")
-
-            if line.startswith(MAGIC):
-                version_part = line.split("/", 1)[1] if "/" in line else "1.0"
-                parsed_version = version_part.split(":")[0]
-                if parsed_version not in SUPPORTED_FORMAT_VERSIONS:
-                    raise ValueError(
-                        f"Unsupported PFM format version: {parsed_version!r}. "
-                        f"Supported: {', '.join(sorted(SUPPORTED_FORMAT_VERSIONS))}"
-                    )
-                self.format_version = parsed_version
+        for start, end, kind in iter_marker_lines(raw):
+            if current_section is not None:
+                self._parse_header_lines(current_section, raw[region_start:start])
+            region_start = end + 1
+
+            if kind == MAGIC_LINE:
+                line = raw[start:end].decode("utf-8").rstrip("\r")
+                self.format_version = _parse_magic_version(line)
                 is_stream = ":STREAM" in line
                 continue
 
-            if line.startswith(SECTION_PREFIX):
-                section_name = line[len(SECTION_PREFIX):]
-                current_section = section_name
-                # Stop at the first content section — header is fully parsed
-                if current_section not in ("meta", "index", "index-trailing"):
-                    break
-                continue
+            if kind == EOF_LINE:
+                continue  # Not a section boundary for header purposes
 
-            if current_section == "meta" and ": " in line:
-                key, val = line.split(": ", 1)
-                key = key.strip()
-                # First-wins: prevent duplicate meta key override (e.g., checksum)
-                if key in self.meta:
-                    continue
-                # Enforce meta field count limit (PFM-014: prevents DoS from crafted files)
-                if len(self.meta) >= MAX_META_FIELDS:
-                    continue
-                self.meta[key] = val.strip()
-
-            if current_section in ("index", "index-trailing"):
-                parts = line.strip().split()
-                if len(parts) == 3 and parts[0] != "checksum":
-                    try:
-                        name, offset, length = parts
-                        off = int(offset)
-                        ln = int(length)
-                    except ValueError:
-                        continue
-                    # PFM-008: Validate index bounds
-                    if 0 <= off and off + ln <= self._file_size:
-                        self.index.add(name, off, ln)
+            current_section = raw[start + _SECTION_PREFIX_LEN:end].decode("utf-8").rstrip("\r")
+            # Stop at the first content section — header is fully parsed
+            if current_section not in _NON_CONTENT_SECTIONS:
+                current_section = None
+                break
+
+        if current_section is not None:
+            self._parse_header_lines(current_section, raw[region_start:self._file_size])
 
         # If stream mode and no index found yet, scan from the end
         if is_stream and not self.index.entries:
             self._parse_trailing_index()
 
+    def _parse_header_lines(self, section: str, chunk: bytes) -> None:
+        """Parse the lines of one meta or index region."""
+        if section in _INDEX_SECTIONS:
+            # Index lines are split and int()-parsed as bytes — no decode,
+            # strip or str.split per entry.
+            for line in chunk.split(b"\n"):
+                self._add_index_entry(line.split())
+            return
+
+        for line in chunk.decode("utf-8").split("\n"):
+            key, sep, val = line.rstrip("\r").partition(": ")
+            if not sep:
+                continue
+            key = key.strip()
+            # First-wins: prevent duplicate meta key override (e.g., checksum)
+            if key in self.meta:
+                continue
+            # Enforce meta field count limit (PFM-014: prevents DoS from crafted files)
+            if len(self.meta) >= MAX_META_FIELDS:
+                continue
+            self.meta[key] = val.strip()
+
+    def _add_index_entry(self, parts: list[bytes]) -> None:
+        """Add one split ``name offset length`` index line, if well-formed."""
+        if len(parts) != 3 or parts[0] == b"checksum":
+            return
+        try:
+            off = int(parts[1])
+            ln = int(parts[2])
+        except ValueError:
+            return
+        # PFM-008: Validate index bounds
+        if 0 <= off and off + ln <= self._file_size:
+            self.index.add(parts[0].decode("utf-8"), off, ln)
+
     def _parse_trailing_index(self) -> None:
         """Parse trailing index from the end of a stream-mode file.
 
-        Reads backward from EOF to find the index-trailing section.
+        Locates the last index-trailing header with a single ``rfind`` over
+        the tail of the map, then parses forward from it — only the pages
+        holding the trailing block are touched.
         """
-        # Read the tail of the file (trailing index is typically < 4KB)
-        tail_size = min(self._file_size, 64 * 1024)
-        self._handle.seek(self._file_size - tail_size)
-        tail = self._handle.read(tail_size).decode("utf-8")
-        lines = tail.split("\n")
-
-        for line in reversed(lines):
-            if line.startswith(EOF_MARKER):
-                continue
-            if line.startswith(f"{SECTION_PREFIX}index-trailing"):
-                break  # Found the start of trailing index, we're done
-            if line.strip() == "":
+        # The trailing index is typically < 4KB; never search beyond the tail
+        size = self._file_size
+        tail_start = max(0, size - 64 * 1024)
+        pos = self._raw.rfind(b"\n" + SECTION_PREFIX_BYTES + b"index-trailing", tail_start, size)
+        if pos < 0:
+            return
+        body_start = self._raw.find(b"\n", pos + 1)
+        if body_start < 0:
+            return
+
+        checksum_seen = False
+        for line in self._raw[body_start + 1:size].split(b"\n"):
+            if line.startswith(EOF_BYTES):
                 continue
-            parts = line.strip().split()
-            if len(parts) == 3 and parts[0] != "checksum":
-                try:
-                    name, offset, length = parts[0], int(parts[1]), int(parts[2])
-                    # PFM-008: Validate bounds
-                    if 0 <= offset and offset + length <= self._file_size:
-                        self.index.add(name, offset, length)
-                except ValueError:
-                    continue
-            elif len(parts) == 2 and parts[0] == "checksum":
-                self.meta["checksum"] = parts[1]
-
-    def _read_raw(self, offset: int, length: int) -> bytes:
-        """Seek to offset and read exactly length bytes."""
-        self._handle.seek(offset)
-        return self._handle.read(length)
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == b"checksum":
+                # First-wins, like meta: a later line cannot override it
+                if not checksum_seen:
+                    self.meta["checksum"] = parts[1].decode("utf-8")
+                    checksum_seen = True
+            else:
+                self._add_index_entry(parts)
+
+    def _section_end(self, offset: int, length: int) -> int:
+        """End of a section body, excluding the newline the writer appends."""
+        end = offset + length
+        if end > offset and self._raw[end - 1] == 0x0A:
+            end -= 1
+        return end
+
+    def _read_section(self, offset: int, length: int) -> str:
+        """Decode and unescape one section with a single slice."""
+        raw = self._raw[offset:self._section_end(offset, length)]
+        return unescape_content(raw.decode("utf-8"))
 
     def get_section(self, name: str) -> str | None:
         """O(1) indexed access to a section's content.
 
-        Seeks directly to the byte offset in the file and reads only the
-        requested section — no other data is loaded.
+        Slices directly at the byte offset in the mapped file and decodes
+        only the requested section — no other data is loaded. The last
+        SECTION_CACHE_SIZE decoded sections are cached, so repeated lookups
+        of a hot section skip the decode and unescape.
         """
+        cache = self._section_cache
+        if name in cache:
+            cache.move_to_end(name)
+            return cache[name]
         entry = self.index.get(name)
         if entry is None:
             return None
-        offset, length = entry
-        raw = self._read_raw(offset, length).decode("utf-8")
-        # Strip trailing newline that writer adds for format correctness
-        if raw.endswith("\n"):
-            raw = raw[:-1]
-        return unescape_content(raw)
+        content = self._read_section(*entry)
+        cache[name] = content
+        if len(cache) > SECTION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return content
 
     def get_sections(self, name: str) -> list[str]:
         """Get all sections with the given name."""
-        results = []
-        for offset, length in self.index.get_all(name):
-            raw = self._read_raw(offset, length).decode("utf-8")
-            # Strip trailing newline that writer adds for format correctness
-            if raw.endswith("\n"):
-                raw = raw[:-1]
-            results.append(unescape_content(raw))
-        return results
+        return [self._read_section(offset, length) for offset, length in self.index.get_all(name)]
+
+    def iter_sections(
+        self, wanted: Callable[[str], bool] | None = None
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(name, content)`` for every indexed section, in file order.
+
+        With ``wanted``, sections whose name it rejects are skipped before
+        they are sliced or decoded.
+        """
+        entries = sorted(
+            (offset, length, name)
+            for name, locations in self.index.entries.items()
+            if wanted is None or wanted(name)
+            for offset, length in locations
+        )
+        for offset, length, name in entries:
+            yield name, self._read_section(offset, length)
 
     @property
     def section_names(self) -> list[str]:
@@ -408,15 +712,13 @@ class PFMReaderHandle:
 
     def to_document(self) -> PFMDocument:
         """Convert to full PFMDocument (reads all sections from disk)."""
-        self._handle.seek(0)
-        data = self._handle.read()
-        return PFMReader.parse(data)
+        return PFMReader.parse(self._raw[:])
 
     def validate_checksum(self) -> bool:
         """Validate the checksum in meta against actual content.
 
         PFM-005 fix: Returns False if no checksum is present (fail-closed).
-        Reads each section via seek — does not load the full file.
+        Reads each section by offset — does not load the full file.
         """
         expected = self.meta.get("checksum", "")
         if not expected:
@@ -425,25 +727,31 @@ class PFMReaderHandle:
         # Checksum is computed from UNESCAPED section content strings
         # (without trailing newline), matching PFMDocument.compute_checksum().
         # Sort by offset to ensure consistent order regardless of how
-        # the index was parsed (trailing index reads in reverse).
+        # how entries are grouped by name in the index.
         all_entries = []
         for name in self.index.section_names:
             for offset, length in self.index.get_all(name):
                 all_entries.append((offset, length))
         all_entries.sort()
 
-        h = hashlib.sha256()
-        for offset, length in all_entries:
-            chunk = self._read_raw(offset, length)
-            # Strip the trailing newline that the writer appends
-            if chunk.endswith(b"\n"):
-                chunk = chunk[:-1]
-            # Unescape before checksumming (checksum covers original content)
-            unescaped = unescape_content(chunk.decode("utf-8")).encode("utf-8")
-            h.update(unescaped)
+        raw = self._raw
+        h = _SHA256_PROTO.copy()
+        with memoryview(raw) as mv:
+            for offset, length in all_entries:
+                end = self._section_end(offset, length)
+                # Unescape before checksumming (checksum covers original content).
+                # Sections without escaped lines hash straight from the buffer.
+                if raw[offset:offset + 1] != b"\\" and raw.find(b"\n\\", offset, end) < 0:
+                    h.update(mv[offset:end])
+                else:
+                    chunk = raw[offset:end].decode("utf-8")
+                    h.update(unescape_content(chunk).encode("utf-8"))
         return _hmac.compare_digest(h.hexdigest(), expected)
 
     def close(self) -> None:
+        self._section_cache.clear()
+        if isinstance(self._raw, mmap.mmap):
+            self._raw.close()
         self._handle.close()
 
     def __enter__(self) -> PFMReaderHandle:
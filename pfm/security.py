@@ -6,7 +6,8 @@ Security features:
   - Content integrity verification via checksum (fail-closed)
   - AES-256-GCM encryption with AAD binding for sensitive .pfm files
   - Tamper detection (signature covers meta + section order + contents)
-  - Key derivation via PBKDF2 for password-based encryption
+  - Key derivation via PBKDF2 (PFM-ENC/1.0) or scrypt (PFM-ENC/2.0), memoized per salt
+    (bounded; clear_key_cache() drops the memoized keys)
 """
 
 from __future__ import annotations
@@ -15,7 +16,11 @@ import hashlib
 import hmac
 import os
 import struct
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from pfm.document import PFMDocument
@@ -23,6 +28,19 @@ if TYPE_CHECKING:
 # AAD (Additional Authenticated Data) for AES-GCM binding
 _AES_AAD = b"PFM-ENC/1.0"
 
+# Plaintext header identifying an encrypted PFM file
+_ENC_MAGIC = b"#!PFM-ENC/"
+_ENC_HEADER = _ENC_MAGIC + b"1.0\n"
+
+# 4-byte big-endian length prefix for canonical signing fields
+_LEN_PREFIX = struct.Struct(">I")
+
+# BLAKE2b personalization for fingerprint() (domain separation, versioned)
+_FINGERPRINT_PERSON = b"pfm-fp-v1"
+
+# Meta keys written by sign() that are never part of the signed message
+_SIGNATURE_META_KEYS = frozenset({"signature", "sig_algo"})
+
 
 # =============================================================================
 # HMAC Signing & Verification
@@ -42,14 +60,8 @@ def sign(doc: PFMDocument, secret: str | bytes) -> str:
 
     # Build the message to sign, excluding any existing sig fields
     # so that sign() and verify() always use the same message.
-    import copy as _copy
-    doc_copy = _copy.copy(doc)
-    doc_copy.custom_meta = {
-        k: v for k, v in doc.custom_meta.items()
-        if k not in ("signature", "sig_algo")
-    }
-    message = _build_signing_message(doc_copy)
-    signature = hmac.new(secret, message, hashlib.sha256).hexdigest()
+    message = _build_signing_message(doc, exclude_meta=_SIGNATURE_META_KEYS)
+    signature = hmac.digest(secret, message, "sha256").hex()
 
     doc.custom_meta["signature"] = signature
     doc.custom_meta["sig_algo"] = "hmac-sha256"
@@ -65,8 +77,7 @@ def verify(doc: PFMDocument, secret: str | bytes, *, require: bool = False) -> b
     If require=True, raises ValueError when no signature is present
     (distinguishes 'never signed' from 'signature stripped').
 
-    Thread-safe: uses a shallow copy of the document to avoid any mutation
-    of the original during verification.
+    Thread-safe: a pure read of the document — nothing is copied or mutated.
     """
     stored_sig = doc.custom_meta.get("signature", "")
     if not stored_sig:
@@ -76,48 +87,102 @@ def verify(doc: PFMDocument, secret: str | bytes, *, require: bool = False) -> b
 
     if isinstance(secret, str):
         secret = secret.encode("utf-8")
+    return _signature_matches(doc, stored_sig, secret)
+
+
+def _signature_matches(
+    doc: PFMDocument, stored_sig: str, secret: bytes, keyed: hmac.HMAC | None = None
+) -> bool:
+    """Recompute the HMAC and compare it with stored_sig in constant time.
+
+    keyed is an hmac.new(secret, digestmod="sha256") prototype; batch callers
+    pass one and each check copies it, skipping the per-call HMAC key setup.
+    """
+    # Signature fields are skipped while building the message, so the
+    # document is never copied or touched.
+    message = _build_signing_message(doc, exclude_meta=_SIGNATURE_META_KEYS)
+    if keyed is None:
+        expected = hmac.digest(secret, message, "sha256")
+    else:
+        mac = keyed.copy()
+        mac.update(message)
+        expected = mac.digest()
+
+    # Compare raw digests; a stored value that isn't valid hex can't match
+    try:
+        stored = bytes.fromhex(stored_sig)
+    except ValueError:
+        return False
+    return hmac.compare_digest(stored, expected)
 
-    # Thread-safe: build signing message from a snapshot that excludes
-    # signature/sig_algo, without ever touching the original dict.
-    from pfm.document import PFMDocument as _Doc
-    import copy as _copy
-    doc_copy = _copy.copy(doc)
-    doc_copy.custom_meta = {
-        k: v for k, v in doc.custom_meta.items()
-        if k not in ("signature", "sig_algo")
-    }
-    message = _build_signing_message(doc_copy)
-    expected = hmac.new(secret, message, hashlib.sha256).hexdigest()
 
-    return hmac.compare_digest(stored_sig, expected)
+def verify_many(
+    sources: Iterable[PFMDocument | str | Path],
+    secret: str | bytes,
+    *,
+    max_workers: int | None = None,
+) -> list[bool]:
+    """
+    Verify many documents or .pfm paths against one secret.
+    Returns one verify() result per source, in input order.
 
+    Paths are read and verified on a thread pool (os.cpu_count() workers by
+    default), so file IO overlaps with the hashing of other documents;
+    hashlib and OpenSSL HMAC release the GIL while digesting large buffers.
+    Read errors propagate as they would from PFMReader.read().
+    """
+    from pfm.reader import PFMReader
 
-def _build_signing_message(doc: PFMDocument) -> bytes:
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    # Key the HMAC once for the whole batch; each check copies the prototype
+    keyed = hmac.new(secret, digestmod="sha256")
+
+    def _verify_one(source: PFMDocument | str | Path) -> bool:
+        if isinstance(source, (str, Path)):
+            source = PFMReader.read(source, keep_utf8=True)  # Checked, then dropped
+        stored_sig = source.custom_meta.get("signature", "")
+        if not stored_sig:
+            return False
+        return _signature_matches(source, stored_sig, secret, keyed)
+
+    sources = list(sources)
+    if len(sources) <= 1:
+        return [_verify_one(source) for source in sources]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(_verify_one, sources))
+
+
+def _build_signing_message(
+    doc: PFMDocument, exclude_meta: frozenset[str] = frozenset()
+) -> bytes:
     """
     Build the canonical message bytes for signing.
 
     Uses length-prefixed encoding to prevent delimiter confusion (PFM-011 fix).
     Each field is: 4-byte big-endian length + raw bytes.
     Section ordering is preserved in the signature (PFM-016 fix).
+    Meta keys in exclude_meta are left out of the message.
     """
     buf = bytearray()
+    pack_len = _LEN_PREFIX.pack
 
     def _append(data: bytes) -> None:
-        buf.extend(struct.pack(">I", len(data)))
+        buf.extend(pack_len(len(data)))
         buf.extend(data)
 
     # Include format version
     _append(doc.format_version.encode("utf-8"))
 
     # Include meta fields in deterministic order
-    meta = doc.get_meta_dict()
-    for key in sorted(meta.keys()):
-        _append(f"{key}={meta[key]}".encode("utf-8"))
+    for key, val in sorted(doc.get_meta_dict().items()):
+        if key not in exclude_meta:
+            _append(f"{key}={val}".encode("utf-8"))
 
     # Include all section names and contents (order matters)
     for section in doc.sections:
         _append(section.name.encode("utf-8"))
-        _append(section.content.encode("utf-8"))
+        _append(section.content_bytes)
 
     return bytes(buf)
 
@@ -126,81 +191,253 @@ def _build_signing_message(doc: PFMDocument) -> bytes:
 # AES-256-GCM Encryption
 # =============================================================================
 
-def _derive_key(password: str, salt: bytes) -> bytes:
-    """Derive a 256-bit key from a password using PBKDF2."""
-    return hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations=600_000,  # OWASP recommended minimum
-        dklen=32,
+# Key derivation functions. "pbkdf2" is the 1.0 wire format (also readable
+# by the browser extension through WebCrypto). "scrypt" is memory-hard and is
+# written as PFM-ENC/2.0 with its parameters carried in the header, e.g.
+# "#!PFM-ENC/2.0:scrypt:n=32768,r=8,p=1".
+_SCRYPT_DEFAULT_PARAMS = (2**15, 8, 1)  # n, r, p — 32 MiB, ~0.1s
+# Bounds for header-supplied scrypt parameters (prevents a crafted header
+# from demanding unbounded memory or CPU during decryption)
+_SCRYPT_MAX_MEMORY = 256 * 1024 * 1024
+_SCRYPT_MAX_P = 16
+
+
+def _parse_scrypt_params(kdf: str) -> tuple[int, int, int]:
+    """Parse "scrypt" or "scrypt:n=<n>,r=<r>,p=<p>" into validated (n, r, p)."""
+    name, _, params = kdf.partition(":")
+    if name != "scrypt":
+        raise ValueError(f"Unsupported key derivation function: {kdf!r}")
+    if not params:
+        return _SCRYPT_DEFAULT_PARAMS
+
+    values: dict[str, int] = {}
+    for item in params.split(","):
+        key, sep, val = item.partition("=")
+        if not sep or key in values or not val.isdigit():
+            raise ValueError(f"Malformed scrypt parameters: {params!r}")
+        values[key] = int(val)
+    if set(values) != {"n", "r", "p"}:
+        raise ValueError(f"Malformed scrypt parameters: {params!r}")
+
+    n, r, p = values["n"], values["r"], values["p"]
+    if n < 2 or n & (n - 1) or r < 1 or not 1 <= p <= _SCRYPT_MAX_P:
+        raise ValueError(f"Invalid scrypt parameters: {params!r}")
+    if 128 * n * r > _SCRYPT_MAX_MEMORY:
+        raise ValueError(f"scrypt parameters exceed memory limit: {params!r}")
+    return n, r, p
+
+
+def _kdf_spec(kdf: str) -> str:
+    """Normalize a KDF name into its canonical spec string."""
+    if kdf == "pbkdf2":
+        return kdf
+    n, r, p = _parse_scrypt_params(kdf)
+    return f"scrypt:n={n},r={r},p={p}"
+
+
+def _kdf_aad(spec: str) -> bytes:
+    """AAD for a KDF spec. scrypt binds its parameters into the AAD."""
+    if spec == "pbkdf2":
+        return _AES_AAD
+    return f"PFM-ENC/2.0:{spec}".encode("ascii")
+
+
+def _kdf_header(spec: str) -> bytes:
+    """Plaintext encrypted-file header for a KDF spec."""
+    if spec == "pbkdf2":
+        return _ENC_HEADER
+    return f"#!PFM-ENC/2.0:{spec}\n".encode("ascii")
+
+
+# Derived keys are memoized per (password, salt, kdf) so repeated decryption
+# of the same payload — or of a batch sharing one salt — derives the key once.
+# Cache keys use a keyed BLAKE2b tag (random per process) so the cache never
+# holds the password or a plain, offline-attackable hash of it. The derived
+# keys themselves stay in memory until evicted or clear_key_cache() is called.
+_KDF_CACHE_MAX = 32
+_KDF_CACHE_TAG_KEY = os.urandom(32)
+_kdf_cache: OrderedDict[tuple[bytes, bytes, str], bytes] = OrderedDict()
+_kdf_cache_lock = threading.Lock()
+
+
+def _derive_key(password: str, salt: bytes, kdf: str = "pbkdf2") -> bytes:
+    """Derive a 256-bit key from a password using PBKDF2 or scrypt (memoized)."""
+    spec = _kdf_spec(kdf)
+    password_bytes = password.encode("utf-8")
+    cache_key = (
+        hashlib.blake2b(password_bytes, digest_size=16, key=_KDF_CACHE_TAG_KEY).digest(),
+        bytes(salt),
+        spec,
     )
+    with _kdf_cache_lock:
+        key = _kdf_cache.get(cache_key)
+        if key is not None:
+            _kdf_cache.move_to_end(cache_key)
+            return key
+
+    if spec == "pbkdf2":
+        key = hashlib.pbkdf2_hmac(
+            "sha256",
+            password_bytes,
+            salt,
+            iterations=600_000,  # OWASP recommended minimum
+            dklen=32,
+        )
+    else:
+        n, r, p = _parse_scrypt_params(spec)
+        key = hashlib.scrypt(
+            password_bytes,
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=_SCRYPT_MAX_MEMORY + 1024 * 1024,
+            dklen=32,
+        )
+    with _kdf_cache_lock:
+        _kdf_cache[cache_key] = key
+        if len(_kdf_cache) > _KDF_CACHE_MAX:
+            _kdf_cache.popitem(last=False)
+    return key
 
 
-def encrypt_bytes(data: bytes, password: str) -> bytes:
+def clear_key_cache() -> None:
     """
-    Encrypt raw bytes with AES-256-GCM using a password.
-    Returns: salt (16) + nonce (12) + ciphertext + tag (16)
-
-    Uses AAD to bind the encryption to PFM context (PFM-006 fix).
+    Drop every memoized derived key.
+    Call when a password is no longer needed (e.g. after a batch job) so
+    its derived keys don't stay in process memory.
     """
+    with _kdf_cache_lock:
+        _kdf_cache.clear()
+
+
+def _require_aesgcm(action: str):
+    """Import AESGCM, raising a helpful ImportError if cryptography is missing."""
     try:
         from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     except ImportError:
         raise ImportError(
-            "The 'cryptography' package is required for encryption. "
+            f"The 'cryptography' package is required for {action}. "
             "Install it with: pip install cryptography"
         )
+    return AESGCM
+
+
+def encrypt_bytes(data: bytes, password: str, *, kdf: str = "pbkdf2") -> bytes:
+    """
+    Encrypt raw bytes with AES-256-GCM using a password.
+    Returns: salt (16) + nonce (12) + ciphertext + tag (16)
 
+    Uses AAD to bind the encryption to PFM context (PFM-006 fix).
+    kdf selects the key derivation ("pbkdf2" or "scrypt"); the same value
+    must be passed to decrypt_bytes().
+    """
+    AESGCM = _require_aesgcm("encryption")
+
+    spec = _kdf_spec(kdf)
     salt = os.urandom(16)
     nonce = os.urandom(12)
-    key = _derive_key(password, salt)
+    key = _derive_key(password, salt, spec)
 
     aesgcm = AESGCM(key)
-    ciphertext = aesgcm.encrypt(nonce, data, _AES_AAD)
+    ciphertext = aesgcm.encrypt(nonce, data, _kdf_aad(spec))
 
     return salt + nonce + ciphertext
 
 
-def decrypt_bytes(encrypted: bytes, password: str) -> bytes:
+def encrypt_bytes_batch(
+    items: Iterable[bytes], password: str, *, kdf: str = "pbkdf2"
+) -> list[bytes]:
+    """
+    Encrypt many byte strings under one derived key.
+    Returns one encrypt_bytes()-compatible payload per item.
+
+    The key is derived once from a single random salt shared by the batch,
+    and one AES-GCM context (expanded key schedule) is reused for every
+    item, each with a fresh random nonce. Because the salt is shared, a
+    password guess can be tested against the whole batch at once.
+    """
+    AESGCM = _require_aesgcm("encryption")
+
+    spec = _kdf_spec(kdf)
+    aad = _kdf_aad(spec)
+    salt = os.urandom(16)
+    aesgcm = AESGCM(_derive_key(password, salt, spec))
+    results = []
+    for data in items:
+        nonce = os.urandom(12)
+        results.append(salt + nonce + aesgcm.encrypt(nonce, data, aad))
+    return results
+
+
+def decrypt_bytes(encrypted: bytes, password: str, *, kdf: str = "pbkdf2") -> bytes:
     """
     Decrypt bytes that were encrypted with encrypt_bytes().
     Expects: salt (16) + nonce (12) + ciphertext + tag (16)
     """
-    try:
-        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-    except ImportError:
-        raise ImportError(
-            "The 'cryptography' package is required for decryption. "
-            "Install it with: pip install cryptography"
-        )
+    AESGCM = _require_aesgcm("decryption")
 
+    spec = _kdf_spec(kdf)
     salt = encrypted[:16]
     nonce = encrypted[16:28]
     ciphertext = encrypted[28:]
 
-    key = _derive_key(password, salt)
+    key = _derive_key(password, salt, spec)
     aesgcm = AESGCM(key)
 
-    return aesgcm.decrypt(nonce, ciphertext, _AES_AAD)
+    return aesgcm.decrypt(nonce, ciphertext, _kdf_aad(spec))
 
 
-def encrypt_document(doc: PFMDocument, password: str) -> bytes:
+def encrypt_document(doc: PFMDocument, password: str, *, kdf: str = "pbkdf2") -> bytes:
     """
     Encrypt an entire PFM document.
     Returns encrypted bytes that can be written to a .pfm.enc file.
 
     The encrypted payload is prefixed with a plaintext magic header
-    so tools can identify it as an encrypted PFM file.
+    so tools can identify it as an encrypted PFM file. kdf="scrypt"
+    writes a PFM-ENC/2.0 header that records the scrypt parameters.
     """
     from pfm.writer import PFMWriter
 
+    spec = _kdf_spec(kdf)
     plaintext = PFMWriter.serialize(doc)
-    encrypted = encrypt_bytes(plaintext, password)
+    encrypted = encrypt_bytes(plaintext, password, kdf=spec)
 
     # Prefix with identifiable header
-    header = b"#!PFM-ENC/1.0\n"
-    return header + encrypted
+    return _kdf_header(spec) + encrypted
+
+
+def encrypt_documents(
+    docs: Iterable[PFMDocument],
+    password: str,
+    *,
+    share_salt: bool = False,
+    kdf: str = "pbkdf2",
+) -> list[bytes]:
+    """
+    Encrypt many PFM documents with one password.
+    Returns one encrypt_document()-compatible payload per document.
+
+    By default every document gets its own salt, so the KDF runs once per
+    document — identical to calling encrypt_document() in a loop.
+
+    share_salt=True derives the key once for the whole batch and encrypts
+    each document under it with a fresh random nonce. This amortizes the KDF
+    across the batch, but a password guess can then be tested against all
+    documents at once. Only opt in when that trade-off is acceptable.
+
+    Either way, derived keys are memoized in process memory (at most
+    _KDF_CACHE_MAX of them) so later decryption skips the KDF; call
+    clear_key_cache() once the password is no longer needed.
+    """
+    from pfm.writer import PFMWriter
+
+    if not share_salt:
+        return [encrypt_document(doc, password, kdf=kdf) for doc in docs]
+
+    header = _kdf_header(_kdf_spec(kdf))
+    plaintexts = (PFMWriter.serialize(doc) for doc in docs)
+    return [header + enc for enc in encrypt_bytes_batch(plaintexts, password, kdf=kdf)]
 
 
 def decrypt_document(data: bytes, password: str) -> "PFMDocument":
@@ -209,11 +446,12 @@ def decrypt_document(data: bytes, password: str) -> "PFMDocument":
     Expects data from encrypt_document().
 
     PFM-016 fix: Validates header format and minimum payload size before decryption.
+    The header version selects the KDF: 1.0 is PBKDF2, 2.0 names its KDF.
     """
     from pfm.reader import PFMReader
 
     # Validate header
-    if not data.startswith(b"#!PFM-ENC/"):
+    if not data.startswith(_ENC_MAGIC):
         raise ValueError("Data is not an encrypted PFM file (missing header)")
     if b"\n" not in data:
         raise ValueError("Malformed encrypted PFM file: missing header terminator")
@@ -221,6 +459,16 @@ def decrypt_document(data: bytes, password: str) -> "PFMDocument":
     header_end = data.index(b"\n") + 1
     encrypted = data[header_end:]
 
+    try:
+        header = data[len(_ENC_MAGIC):header_end - 1].decode("ascii")
+    except UnicodeDecodeError:
+        raise ValueError("Malformed encrypted PFM file: non-ASCII header")
+    version, _, kdf = header.partition(":")
+    if version == "1.0" and not kdf:
+        kdf = "pbkdf2"
+    elif version != "2.0" or not kdf.startswith("scrypt:"):
+        raise ValueError(f"Unsupported encrypted PFM header: {header!r}")
+
     # Minimum payload: 16 (salt) + 12 (nonce) + 16 (GCM tag) = 44 bytes
     if len(encrypted) < 44:
         raise ValueError(
@@ -228,39 +476,47 @@ def decrypt_document(data: bytes, password: str) -> "PFMDocument":
             f"(minimum 44 bytes: 16 salt + 12 nonce + 16 tag)"
         )
 
-    plaintext = decrypt_bytes(encrypted, password)
+    plaintext = decrypt_bytes(encrypted, password, kdf=kdf)
     return PFMReader.parse(plaintext)
 
 
 def is_encrypted_pfm(data: bytes) -> bool:
     """Check if data is an encrypted PFM file."""
-    return data.startswith(b"#!PFM-ENC/")
+    return data.startswith(_ENC_MAGIC)
 
 
 # =============================================================================
 # Content Integrity
 # =============================================================================
 
-def verify_integrity(doc: PFMDocument) -> bool:
+def verify_integrity(doc: PFMDocument, *, computed: str | None = None) -> bool:
     """
     Verify document integrity by recomputing and comparing checksum.
+    Pass computed= (a doc.compute_checksum() result) to skip the rehash.
 
     PFM-005 fix: Returns False if no checksum is stored (fail-closed).
     PFM-017 fix: Uses constant-time comparison to prevent timing side-channels.
     """
     if not doc.checksum:
         return False  # No checksum = not verified
-    return hmac.compare_digest(doc.checksum, doc.compute_checksum())
+    if computed is None:
+        computed = doc.compute_checksum()
+    return hmac.compare_digest(doc.checksum, computed)
 
 
-def fingerprint(doc: PFMDocument) -> str:
+def fingerprint(doc: PFMDocument, *, algo: str = "blake2b") -> str:
     """
     Generate a unique fingerprint for a document.
     Based on id + checksum + creation time.
     Useful for deduplication and tracking.
 
-    Uses 32 hex characters (128 bits) for adequate collision resistance.
-    Previous 16-char truncation only provided 64-bit / 32-bit birthday resistance.
+    Uses 64 hex characters (256 bits) for collision resistance. BLAKE2b
+    (personalized, so it can't collide with other BLAKE2b uses) is the
+    default; algo="sha256" reproduces fingerprints stored by older releases.
     """
-    material = f"{doc.id}:{doc.checksum}:{doc.created}"
-    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    material = f"{doc.id}:{doc.checksum}:{doc.created}".encode("utf-8")
+    if algo == "blake2b":
+        return hashlib.blake2b(material, digest_size=32, person=_FINGERPRINT_PERSON).hexdigest()
+    if algo == "sha256":
+        return hashlib.sha256(material).hexdigest()
+    raise ValueError(f"Unsupported fingerprint algorithm: {algo!r}")
@@ -46,6 +46,8 @@ Checksum Protocol:
 Priority: Speed > Indexing > Human Readability > AI Usefulness
 """
 
+import re
+
 # Magic bytes - first line of every .pfm file
 MAGIC = "#!PFM"
 EOF_MARKER = "#!END"
@@ -67,6 +69,8 @@ MAX_SECTIONS = 10_000              # Max sections per document (prevents resourc
 MAX_META_FIELDS = 100              # Max custom meta fields
 MAX_SECTION_NAME_LENGTH = 64       # Max length for section names
 ALLOWED_SECTION_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+# Compiled once: fullmatch() validates a whole name in C, no per-char loop
+SECTION_NAME_RE = re.compile(r"[a-z0-9_\-]+")
 
 # Reserved section names (users can define custom ones too)
 SECTION_TYPES = {
@@ -136,11 +140,33 @@ def unescape_content_line(line: str) -> str:
     return line
 
 
+# Whole-string forms of escape_content_line / unescape_content_line: one
+# C-level substitution instead of a Python call per line.
+_MARKER_LOOKAHEAD = r"(?=\\*(?:" + "|".join(
+    re.escape(marker) for marker in (SECTION_PREFIX, MAGIC, EOF_MARKER)
+) + r"))"
+_ESCAPE_RE = re.compile("^" + _MARKER_LOOKAHEAD, re.MULTILINE)
+_UNESCAPE_RE = re.compile(r"^\\" + _MARKER_LOOKAHEAD, re.MULTILINE)
+
+
+def _may_need_escaping(content: str) -> bool:
+    """Cheap pre-check: only lines starting with '#' or '\\' can be affected."""
+    return (
+        content.startswith(("#", "\\"))
+        or "\n#" in content
+        or "\n\\" in content
+    )
+
+
 def escape_content(content: str) -> str:
     """Escape all lines in a content string."""
-    return "\n".join(escape_content_line(line) for line in content.split("\n"))
+    if not _may_need_escaping(content):
+        return content
+    return _ESCAPE_RE.sub(r"\\", content)
 
 
 def unescape_content(content: str) -> str:
     """Unescape all lines in a content string."""
-    return "\n".join(unescape_content_line(line) for line in content.split("\n"))
+    if not _may_need_escaping(content):
+        return content
+    return _UNESCAPE_RE.sub("", content)
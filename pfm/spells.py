@@ -21,9 +21,15 @@ Usage:
 
 from __future__ import annotations
 
+import os
+import tempfile
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
     from pfm.document import PFMDocument
 
 
@@ -35,7 +41,8 @@ def accio(path: str, section: str) -> str | None:
     """
     Summon a section from a .pfm file by name.
 
-    Uses indexed O(1) access — doesn't parse the whole file.
+    Uses indexed O(1) access — doesn't parse the whole file. Files without
+    an index (e.g. an unfinalized stream) fall back to a full parse.
 
         content = accio("report.pfm", "content")
         chain = accio("report.pfm", "chain")
@@ -43,7 +50,10 @@ def accio(path: str, section: str) -> str | None:
     from pfm.reader import PFMReader
 
     with PFMReader.open(path) as reader:
-        return reader.get_section(section)
+        if reader.index.entries:
+            return reader.get_section(section)
+        found = reader.to_document().get_section(section)
+        return found.content if found else None
 
 
 # =============================================================================
@@ -108,7 +118,7 @@ def revelio(data: bytes, password: str) -> "PFMDocument":
 # prior_incantato - Validate integrity and provenance
 # =============================================================================
 
-def prior_incantato(doc: "PFMDocument") -> dict:
+def prior_incantato(doc: "PFMDocument", *, compute: bool = True) -> dict:
     """
     Cast Prior Incantato — reveal the history and integrity of a document.
     Returns a dict with validation results.
@@ -116,16 +126,26 @@ def prior_incantato(doc: "PFMDocument") -> dict:
         result = prior_incantato(doc)
         assert result["integrity"]  # checksum valid
         assert result["signed"]     # has signature
+
+    With compute=False, a document without a stored checksum is not hashed:
+    "integrity" and "computed_checksum" come back as None (unknown).
     """
     from pfm.security import verify_integrity, fingerprint
 
+    if doc.checksum or compute:
+        # Hash the sections once; the integrity check reuses the digest
+        computed = doc.compute_checksum()
+        integrity = verify_integrity(doc, computed=computed)
+    else:
+        computed = integrity = None
     return {
-        "integrity": verify_integrity(doc),
+        "integrity": integrity,
         "checksum": doc.checksum or None,
-        "computed_checksum": doc.compute_checksum(),
+        "computed_checksum": computed,
         "signed": bool(doc.custom_meta.get("signature")),
         "sig_algo": doc.custom_meta.get("sig_algo"),
         "fingerprint": fingerprint(doc),
+        "fingerprint_algo": "blake2b",
         "agent": doc.agent,
         "model": doc.model,
         "created": doc.created,
@@ -159,6 +179,23 @@ def vow_kept(doc: "PFMDocument", secret: str | bytes) -> bool:
     return verify(doc, secret)
 
 
+def vow_kept_many(
+    docs: "Iterable[PFMDocument | str]", secret: str | bytes
+) -> list[bool]:
+    """
+    Check many Unbreakable Vows at once — verify signatures in parallel.
+    Accepts PFMDocument objects or file paths; results keep input order.
+
+        results = vow_kept_many(["a.pfm", "b.pfm"], "signing-key")
+
+    Each document's signing message is hashed in one update() call, so
+    sections of a few KB or more let hashlib release the GIL and the
+    checks spread across cores.
+    """
+    from pfm.security import verify_many
+    return verify_many(docs, secret)
+
+
 # =============================================================================
 # geminio - Merge multiple documents into one (Doubling Charm)
 # =============================================================================
@@ -197,53 +234,171 @@ def geminio(*sources: "PFMDocument | str", agent: str = "", model: str = "") ->
         else:
             docs.append(src)
 
-    MAX_TAGS = 100
-    MAX_TAG_LENGTH = 128
-    MAX_ID_LENGTH = 64
-
-    # Collect parent IDs and tags with caps
-    parent_ids = [d.id[:MAX_ID_LENGTH] for d in docs if d.id]
-    all_tags: list[str] = []
-    for d in docs:
-        if d.tags:
-            for t in d.tags.split(","):
-                t = t.strip()
-                if t and len(t) <= MAX_TAG_LENGTH:
-                    all_tags.append(t)
-                if len(all_tags) >= MAX_TAGS * len(docs):
-                    break
-    unique_tags = list(dict.fromkeys(all_tags))[:MAX_TAGS]
+    parent, tags = _merge_lineage([(d.id, d.tags) for d in docs])
 
     # Create merged doc
     merged = PFMDocument.create(
         agent=agent or docs[0].agent,
         model=model or docs[0].model,
-        parent=", ".join(parent_ids),
-        tags=", ".join(unique_tags) if unique_tags else "",
+        parent=parent,
+        tags=tags,
     )
 
-    # Merge content sections: concatenate with source headers
-    content_parts: list[str] = []
-    for i, doc in enumerate(docs):
+    # Merge content sections: concatenate with source headers. Section
+    # contents are referenced, not copied into per-part strings, so the
+    # single join below is the only copy of the merged text.
+    # Per-source headers are formatted once and shared by every section
+    labels = [doc.id[:8] if doc.id else f"source-{i}" for i, doc in enumerate(docs)]
+    content_headers = [
+        f"--- [{label}] {doc.created or 'unknown'} ---\n" for label, doc in zip(labels, docs)
+    ]
+    content_pieces: list[str] = []
+    for doc, header in zip(docs, content_headers):
         for section in doc.sections:
             if section.name == "content":
-                source_label = doc.id[:8] if doc.id else f"source-{i}"
-                created = doc.created or "unknown"
-                content_parts.append(
-                    f"--- [{source_label}] {created} ---\n{section.content}"
-                )
+                if content_pieces:
+                    content_pieces.append("\n\n")
+                content_pieces.append(header)
+                content_pieces.append(section.content)
 
-    if content_parts:
-        merged.add_section("content", "\n\n".join(content_parts))
+    if content_pieces:
+        merged.add_section("content", "".join(content_pieces))
 
     # Merge any non-content sections (chain, etc.) — append with source prefix
-    for i, doc in enumerate(docs):
+    for doc, label in zip(docs, labels):
+        header = f"--- [{label}] ---\n"
         for section in doc.sections:
             if section.name != "content":
-                source_label = doc.id[:8] if doc.id else f"source-{i}"
-                merged.add_section(
-                    section.name,
-                    f"--- [{source_label}] ---\n{section.content}",
-                )
+                merged.add_section(section.name, header + section.content)
 
     return merged
+
+
+def _merge_lineage(sources: "list[tuple[str, str]]") -> tuple[str, str]:
+    """Merged (parent, tags) meta for geminio, from each source's (id, tags)."""
+    MAX_TAGS = 100
+    MAX_TAG_LENGTH = 128
+    MAX_ID_LENGTH = 64
+
+    # Collect parent IDs and tags with caps
+    parent_ids = [doc_id[:MAX_ID_LENGTH] for doc_id, _ in sources if doc_id]
+    # Single pass: first occurrence wins, stop as soon as MAX_TAGS are kept
+    seen_tags: set[str] = set()
+    unique_tags: list[str] = []
+    scanned = 0
+    for _, tags in sources:
+        if len(unique_tags) >= MAX_TAGS:
+            break
+        if not tags:
+            continue
+        for t in tags.split(","):
+            t = t.strip()
+            if t and len(t) <= MAX_TAG_LENGTH:
+                scanned += 1
+                if t not in seen_tags and len(unique_tags) < MAX_TAGS:
+                    seen_tags.add(t)
+                    unique_tags.append(t)
+            if scanned >= MAX_TAGS * len(sources):
+                break
+
+    return ", ".join(parent_ids), ", ".join(unique_tags)
+
+
+@contextmanager
+def _open_source(src: "PFMDocument | str") -> "Iterator[tuple[dict[str, str], Callable]]":
+    """Open a geminio source once, yielding (meta, sections).
+
+    sections(wanted) yields (name, content) in file order for the names
+    wanted(name) accepts. Paths are read through the index, so rejected
+    sections are never decoded; files without an index (e.g. an
+    unfinalized stream) fall back to a full parse.
+    """
+    from pfm.reader import PFMReader
+
+    if not isinstance(src, str):
+        yield src.get_meta_dict(), lambda wanted: (
+            (s.name, s.content) for s in src.sections if wanted(s.name)
+        )
+        return
+
+    with PFMReader.open(src) as reader:
+        if reader.index.entries:
+            yield dict(reader.meta), reader.iter_sections
+            return
+        doc = reader.to_document()
+        yield dict(reader.meta), lambda wanted: (
+            (s.name, s.content) for s in doc.sections if wanted(s.name)
+        )
+
+
+def geminio_stream(
+    dest: "str | Path", *sources: "PFMDocument | str", agent: str = "", model: str = ""
+) -> int:
+    """
+    Cast Geminio straight to disk — merge .pfm documents into a stream file.
+    Same merge as geminio(), but written through PFMStreamWriter, so source
+    files are never parsed into whole PFMDocuments and non-content sections
+    are copied one at a time.
+
+        nbytes = geminio_stream("combined.pfm", "part1.pfm", "part2.pfm")
+
+    The merge is written to a temp file and renamed over dest, so dest may
+    be one of the sources. Returns the number of bytes written. As with any
+    PFMStreamWriter output, a section whose content ends in a newline reads
+    back without it.
+    """
+    from pfm.stream import PFMStreamWriter
+
+    if len(sources) < 2:
+        raise ValueError("Geminio requires at least 2 sources to merge")
+
+    # First pass: meta (id, tags, ...) and the content sections to concatenate
+    metas: list[dict[str, str]] = []
+    labels: list[str] = []
+    content_pieces: list[str] = []
+    for i, src in enumerate(sources):
+        with _open_source(src) as (meta, sections):
+            metas.append(meta)
+            labels.append(meta.get("id", "")[:8] or f"source-{i}")
+            content_header = f"--- [{labels[-1]}] {meta.get('created') or 'unknown'} ---\n"
+            for _, content in sections(lambda name: name == "content"):
+                if content_pieces:
+                    content_pieces.append("\n\n")
+                content_pieces.append(content_header)
+                content_pieces.append(content)
+
+    parent, tags = _merge_lineage([(m.get("id", ""), m.get("tags", "")) for m in metas])
+    lineage = {key: val for key, val in (("parent", parent), ("tags", tags)) if val}
+
+    # Merge into a temp file beside dest and rename it over dest at the end:
+    # dest may itself be one of the sources, still to be read in pass two
+    dest = os.path.abspath(dest)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".pfm.tmp")
+    os.close(fd)
+    try:
+        with PFMStreamWriter(
+            tmp_path,
+            agent=agent or metas[0].get("agent", ""),
+            model=model or metas[0].get("model", ""),
+            **lineage,
+        ) as writer:
+            if content_pieces:
+                writer.write_section("content", "".join(content_pieces))
+            content_pieces.clear()  # Release the merged text before copying the rest
+
+            # Second pass: copy the remaining sections (chain, etc.) with a source prefix
+            for src, label in zip(sources, labels):
+                header = f"--- [{label}] ---\n"
+                with _open_source(src) as (_, sections):
+                    for name, content in sections(lambda name: name != "content"):
+                        writer.write_section(name, header + content)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; match PFMStreamWriter
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return writer.bytes_written
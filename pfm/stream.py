@@ -53,17 +53,25 @@ from pathlib import Path
 from pfm.spec import (
     MAGIC, EOF_MARKER, SECTION_PREFIX, FORMAT_VERSION,
     MAX_FILE_SIZE, MAX_SECTIONS, MAX_SECTION_NAME_LENGTH,
-    ALLOWED_SECTION_NAME_CHARS, escape_content, unescape_content,
+    SECTION_NAME_RE, escape_content, unescape_content,
 )
+from pfm.reader import iter_marker_lines
 
 # Reserved section names (matches PFMDocument._RESERVED_SECTION_NAMES)
 _RESERVED_SECTION_NAMES = frozenset({"meta", "index", "index-trailing"})
 
+# Write buffer used when flush_each=False (sections coalesced until flush/close)
+_COALESCE_BUFFER_SIZE = 1 << 20
+
 
 class PFMStreamWriter:
     """
     Streaming .pfm writer. Sections are flushed to disk immediately.
     Index is written on close.
+
+    flush_each=False trades crash durability for throughput: sections are
+    coalesced in a 1 MB write buffer and only reach disk on flush() or
+    close(), so a crash loses everything written since the last flush.
     """
 
     def __init__(
@@ -72,9 +80,11 @@ class PFMStreamWriter:
         agent: str = "",
         model: str = "",
         append: bool = False,
+        flush_each: bool = True,
         **custom_meta: str,
     ) -> None:
         self.path = Path(path)
+        self._flush_each = flush_each
         self._sections: list[tuple[str, int, int]] = []  # (name, offset, length)
         self._checksum = hashlib.sha256()
         self._closed = False
@@ -105,7 +115,7 @@ class PFMStreamWriter:
         else:
             # PFM-019/Stream: Use explicit file permissions (0644) matching PFMWriter
             fd = os.open(str(self.path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
-            self._handle = os.fdopen(fd, "wb")
+            self._handle = os.fdopen(fd, "wb", buffering=-1 if flush_each else _COALESCE_BUFFER_SIZE)
             self._write_header(agent, model, custom_meta)
 
     @staticmethod
@@ -133,7 +143,8 @@ class PFMStreamWriter:
         self._handle.flush()
 
     def write_section(self, name: str, content: str) -> None:
-        """Write a section to disk immediately. Flushes after write.
+        """Write a section to disk immediately. Flushes after write
+        (unless the writer was created with flush_each=False).
 
         PFM-014/Stream: Enforces section count limits.
         PFM-011/Stream: Enforces file size limits.
@@ -148,7 +159,7 @@ class PFMStreamWriter:
             raise ValueError(
                 f"Section name too long: {len(name)} chars (max {MAX_SECTION_NAME_LENGTH})"
             )
-        if not all(c in ALLOWED_SECTION_NAME_CHARS for c in name):
+        if not SECTION_NAME_RE.fullmatch(name):
             raise ValueError(
                 f"Invalid section name: {name!r}. "
                 f"Only lowercase alphanumeric, hyphens, and underscores allowed."
@@ -189,6 +200,13 @@ class PFMStreamWriter:
         self._checksum.update(content.encode("utf-8"))
 
         # Flush to disk immediately — this is the whole point
+        if self._flush_each:
+            self.flush()
+
+    def flush(self) -> None:
+        """Force everything written so far onto disk (flush + fsync)."""
+        if self._closed:
+            raise RuntimeError("Cannot flush a closed PFMStreamWriter")
         self._handle.flush()
         os.fsync(self._handle.fileno())
 
@@ -197,18 +215,18 @@ class PFMStreamWriter:
         if self._closed:
             return
 
-        # Write trailing index
+        # Build the whole trailer (index, checksum, EOF) and write it once
         index_offset = self._handle.tell()
-        self._write(f"{SECTION_PREFIX}index-trailing\n")
-        for name, offset, length in self._sections:
-            self._write(f"{name} {offset} {length}\n")
+        trailer = [f"{SECTION_PREFIX}index-trailing\n"]
+        trailer.extend(f"{name} {offset} {length}\n" for name, offset, length in self._sections)
 
         # Write checksum as part of index block
-        self._write(f"checksum {self._checksum.hexdigest()}\n")
+        trailer.append(f"checksum {self._checksum.hexdigest()}\n")
 
         # EOF with index offset for fast reverse-seeking
-        self._write(f"{EOF_MARKER}:{index_offset}\n")
+        trailer.append(f"{EOF_MARKER}:{index_offset}\n")
 
+        self._write("".join(trailer))
         self._handle.flush()
         os.fsync(self._handle.fileno())
         self._final_size = self._handle.tell()
@@ -293,69 +311,46 @@ def _recover(path: Path) -> tuple:
     backup_path = path.with_suffix(path.suffix + ".bak")
     backup_path.write_bytes(raw)
 
-    text = raw.decode("utf-8")
-    lines = text.split("\n")
-
+    # Locate marker lines with the reader's byte scanner instead of decoding
+    # and walking every line. A section runs from the line after its header
+    # to the start of the next marker line (or the end of a crashed file).
+    n = len(raw)
     sections: list[tuple[str, int, int]] = []
-    byte_pos = 0
-
-    i = 0
     current_section_name: str | None = None
     current_content_start: int = 0
 
-    while i < len(lines):
-        line = lines[i]
-        line_bytes = len(line.encode("utf-8")) + 1  # +1 for newline
-
-        # Only match unescaped section markers
-        if line.startswith(SECTION_PREFIX) and not line.startswith("\\#"):
-            # Flush previous section
-            if current_section_name is not None:
-                length = byte_pos - current_content_start
-                sections.append((current_section_name, current_content_start, length))
-
-            section_tag = line[len(SECTION_PREFIX):]
-
-            # Skip meta, index, and trailing index
-            if section_tag in ("meta", "index", "index-trailing"):
-                current_section_name = None
-            elif (
-                len(section_tag) <= MAX_SECTION_NAME_LENGTH
-                and all(c in ALLOWED_SECTION_NAME_CHARS for c in section_tag)
-            ):
-                current_section_name = section_tag
-                current_content_start = byte_pos + line_bytes
-            else:
-                current_section_name = None  # Skip invalid section names
-
-        elif (line.startswith(EOF_MARKER) or line.startswith(MAGIC)) and not line.startswith("\\#"):
-            # Flush previous section
-            if current_section_name is not None:
-                length = byte_pos - current_content_start
-                sections.append((current_section_name, current_content_start, length))
-                current_section_name = None
-
-        byte_pos += line_bytes
-        i += 1
+    for start, end, kind in iter_marker_lines(raw):
+        # Flush previous section
+        if current_section_name is not None:
+            sections.append((current_section_name, current_content_start, start - current_content_start))
+            current_section_name = None
+        if kind is not None:
+            continue  # Magic or EOF line: closes the section, starts none
+
+        section_tag = raw[start + len(SECTION_PREFIX):end].decode("utf-8")
+
+        # Skip meta, index, and trailing index; skip invalid section names
+        if section_tag not in _RESERVED_SECTION_NAMES and (
+            len(section_tag) <= MAX_SECTION_NAME_LENGTH
+            and SECTION_NAME_RE.fullmatch(section_tag)
+        ):
+            current_section_name = section_tag
+            current_content_start = min(end + 1, n)
 
     # Flush last section if file was truncated (crash)
     if current_section_name is not None:
-        length = byte_pos - current_content_start
-        sections.append((current_section_name, current_content_start, length))
+        sections.append((current_section_name, current_content_start, n - current_content_start))
 
     # Strip any trailing index/EOF for appending
-    # PFM-004 fix: Use rfind to find the LAST occurrence, not the first
-    truncate_at = len(raw)
-    trailing_marker = f"{SECTION_PREFIX}index-trailing"
-    # Search from end of file for trailing index marker
-    rpos = text.rfind(trailing_marker)
-    if rpos >= 0:
-        truncate_at = len(text[:rpos].encode("utf-8"))
-    else:
+    # PFM-004 fix: Use rfind to find the LAST occurrence, not the first.
+    # Anchored at a line start so escaped content lines never match.
+    truncate_at = n
+    rpos = raw.rfind(b"\n" + f"{SECTION_PREFIX}index-trailing".encode("utf-8"))
+    if rpos < 0:
         # No trailing index — look for EOF marker from end
-        eof_pos = text.rfind(EOF_MARKER)
-        if eof_pos >= 0:
-            truncate_at = len(text[:eof_pos].encode("utf-8"))
+        rpos = raw.rfind(b"\n" + EOF_MARKER.encode("utf-8"))
+    if rpos >= 0:
+        truncate_at = rpos + 1
 
     # Lock already acquired at start of _recover()
     handle.seek(truncate_at)
@@ -13,6 +13,7 @@ import io
 from typing import TYPE_CHECKING
 
 from pfm.spec import MAGIC, EOF_MARKER, SECTION_PREFIX, FORMAT_VERSION, escape_content
+from pfm.document import _SHA256_PROTO
 
 if TYPE_CHECKING:
     from pfm.document import PFMDocument
@@ -24,16 +25,21 @@ class PFMWriter:
     def serialize(doc: PFMDocument) -> bytes:
         """Serialize a PFMDocument to bytes. Pure — does not mutate the input document."""
 
-        # Compute checksum without mutating doc
-        checksum = doc.compute_checksum()
-
         # --- Pass 1: Pre-serialize sections (with content escaping) ---
+        # The checksum (same as doc.compute_checksum(), without mutating doc)
+        # is fed incrementally here, reusing the encoded bytes when escaping
+        # left the content unchanged.
+        h = _SHA256_PROTO.copy()
         section_blobs: list[tuple[str, bytes]] = []
         for section in doc.sections:
             header_line = f"{SECTION_PREFIX}{section.name}\n".encode("utf-8")
             # Escape content lines that look like PFM markers
             escaped = escape_content(section.content)
-            content_bytes = escaped.encode("utf-8")
+            if escaped is section.content:
+                content_bytes = section.content_bytes
+            else:
+                content_bytes = escaped.encode("utf-8")
+            h.update(section.content_bytes)
             # ALWAYS append exactly one newline as a format separator.
             # The reader ALWAYS strips exactly one trailing newline.
             # This preserves content that naturally ends with \n:
@@ -41,6 +47,7 @@ class PFMWriter:
             #   "hello\n" -> on disk "hello\n\n" -> reader strips -> "hello\n"
             content_bytes += b"\n"
             section_blobs.append((section.name, header_line + content_bytes))
+        checksum = h.hexdigest()
 
         # --- Build header (magic + meta) ---
         header = io.BytesIO()
@@ -80,6 +80,16 @@ class TestEscapeRoundTrip:
         unescaped = unescape_content(escaped)
         assert unescaped == content
 
+    def test_multiline_matches_per_line(self, vectors):
+        """Whole-string escape/unescape agree with the per-line functions."""
+        lines = [case["input"] for case in vectors["escape_roundtrip"]["cases"]]
+        lines += ["plain", "", "\r", "\\\\", "#", "\\#!END:12"]
+        content = "\n".join(lines)
+        assert escape_content(content) == "\n".join(escape_content_line(l) for l in lines)
+        escaped = "\n".join(escape_content_line(l) for l in lines)
+        assert unescape_content(escaped) == content
+        assert unescape_content(content) == "\n".join(unescape_content_line(l) for l in lines)
+
     def test_no_false_positives(self):
         """Lines that should NOT be escaped remain untouched."""
         safe_lines = [
@@ -3,6 +3,7 @@ Functional Tests - Test writer, reader, and converters working together.
 """
 
 import hashlib
+import os
 import tempfile
 from pathlib import Path
 
@@ -143,6 +144,50 @@ class TestReader:
 
         assert doc.content == multiline
 
+    def test_parse_keep_utf8(self):
+        data = self._make_pfm(content="plain héllo", chain="#@fake\nline 2")
+
+        default = PFMReader.parse(data)
+        assert all(s._content_utf8 is None for s in default.sections)  # Held once, as str
+
+        doc = PFMReader.parse(data, keep_utf8=True)
+        plain, escaped = doc.sections
+        assert plain._content_utf8 == "plain héllo".encode("utf-8")
+        assert escaped._content_utf8 is None  # Unescaped text differs from the raw body
+        assert escaped.content_bytes == b"#@fake\nline 2"
+        assert doc.compute_checksum() == doc.checksum
+
+    def test_bare_section_marker_is_skipped(self, monkeypatch):
+        """A CR before "#@" in content yields a nameless header, which is ignored."""
+        import pfm.reader
+        doc = PFMDocument.create(agent="test")
+        doc.add_section("content", "line one\r#@")
+
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            path = f.name
+
+        doc.write(path)
+        loaded = PFMReader.read(path)
+        assert [(s.name, s.content) for s in loaded.sections] == [("content", "line one")]
+
+        monkeypatch.setattr(pfm.reader, "STREAM_READ_THRESHOLD", 0)
+        streamed = PFMReader.read(path)
+        assert [(s.name, s.content) for s in streamed.sections] == [("content", "line one")]
+        Path(path).unlink()
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+    def test_read_from_pipe(self):
+        """Non-regular files report st_size 0 but must still be read in full."""
+        data = self._make_pfm(content="piped content")
+        r, w = os.pipe()
+        os.write(w, data)
+        os.close(w)
+        try:
+            doc = PFMReader.read(f"/dev/fd/{r}")
+        finally:
+            os.close(r)
+        assert doc.content == "piped content"
+
     def test_is_pfm_file(self):
         data = self._make_pfm()
         with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
@@ -166,6 +211,37 @@ class TestReader:
         assert loaded.content == "from file"
         Path(path).unlink()
 
+    def test_stream_sections(self):
+        data = self._make_pfm(content="#@fake\nline 2\n", chain="prompt history")
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            f.write(data)
+            path = f.name
+
+        # Tiny chunks force markers and lines to straddle chunk boundaries
+        sections = list(PFMReader.stream(path, chunk_size=3))
+        names = [name for name, _ in sections]
+        assert names == ["meta", "index", "content", "chain"]
+        assert dict(sections)["content"] == b"\\#@fake\nline 2\n"  # Still escaped
+        assert dict(sections)["chain"] == b"prompt history"
+        Path(path).unlink()
+
+    def test_read_large_file_streams(self, monkeypatch):
+        import pfm.reader
+        data = self._make_pfm(content="big\r\ncontent", chain="prompt history")
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            f.write(data)
+            path = f.name
+
+        monkeypatch.setattr(pfm.reader, "STREAM_READ_THRESHOLD", 0)
+        monkeypatch.setattr(pfm.reader, "STREAM_CHUNK_SIZE", 5)
+        loaded = PFMReader.read(path)
+        expected = PFMReader.parse(data)
+        assert loaded.get_meta_dict() == expected.get_meta_dict()
+        assert [(s.name, s.content) for s in loaded.sections] == [
+            (s.name, s.content) for s in expected.sections
+        ]
+        Path(path).unlink()
+
 
 # =============================================================================
 # Reader Handle (indexed access)
@@ -210,6 +286,31 @@ class TestReaderHandle:
 
         Path(path).unlink()
 
+    def test_get_section_cached(self, monkeypatch):
+        import pfm.reader as reader_mod
+        monkeypatch.setattr(reader_mod, "SECTION_CACHE_SIZE", 2)
+
+        doc = PFMDocument.create()
+        for name in ("content", "chain", "tools"):
+            doc.add_section(name, f"{name} body")
+
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            path = f.name
+
+        doc.write(path)
+
+        with PFMReader.open(path) as reader:
+            first = reader.get_section("content")
+            assert reader.get_section("content") is first
+            reader.get_section("chain")
+            reader.get_section("tools")
+            # Bounded: least recently used entry was evicted
+            assert list(reader._section_cache) == ["chain", "tools"]
+            assert reader.get_section("content") == "content body"
+
+        assert not reader._section_cache
+        Path(path).unlink()
+
     def test_validate_checksum(self):
         doc = PFMDocument.create()
         doc.add_section("content", "checksum test")
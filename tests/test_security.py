@@ -8,6 +8,7 @@ from pfm.document import PFMDocument
 from pfm.security import (
     sign,
     verify,
+    verify_many,
     verify_integrity,
     fingerprint,
 )
@@ -53,6 +54,14 @@ class TestSigning:
         doc.agent = "evil-agent"
         assert verify(doc, "key") is False
 
+    def test_verify_malformed_signature(self):
+        doc = PFMDocument.create(agent="test")
+        doc.add_section("content", "data")
+
+        sign(doc, "key")
+        doc.custom_meta["signature"] = "not-a-hex-signature"
+        assert verify(doc, "key") is False
+
     def test_verify_unsigned(self):
         doc = PFMDocument.create()
         doc.add_section("content", "unsigned")
@@ -97,6 +106,22 @@ class TestSigning:
         sign(doc, b"\x00\x01\x02\x03")
         assert verify(doc, b"\x00\x01\x02\x03") is True
 
+    def test_verify_many(self, tmp_path):
+        docs = []
+        for i in range(4):
+            doc = PFMDocument.create(agent=f"batch-{i}")
+            doc.add_section("content", f"doc {i}")
+            doc.checksum = doc.compute_checksum()
+            sign(doc, "batch-key")
+            docs.append(doc)
+        docs[1].sections[0].content = "tampered"
+        path = tmp_path / "signed.pfm"
+        docs[0].write(path)
+
+        assert verify_many([*docs, str(path)], "batch-key") == [True, False, True, True, True]
+        assert verify_many([path], "wrong-key") == [False]
+        assert verify_many([], "batch-key") == []
+
 
 class TestEncryption:
     """Tests require the `cryptography` package."""
@@ -154,6 +179,27 @@ class TestEncryption:
         assert decrypted.content == "top secret content"
         assert decrypted.chain == "classified chain"
 
+    def test_encrypt_decrypt_document_scrypt(self):
+        from pfm.security import encrypt_document, decrypt_document
+
+        doc = PFMDocument.create(agent="scrypt-agent")
+        doc.add_section("content", "memory-hard secret")
+
+        encrypted = encrypt_document(doc, "scrypt-password", kdf="scrypt")
+        assert encrypted.startswith(b"#!PFM-ENC/2.0:scrypt:n=32768,r=8,p=1\n")
+        assert decrypt_document(encrypted, "scrypt-password").content == "memory-hard secret"
+
+        with pytest.raises(Exception):  # InvalidTag from AES-GCM
+            decrypt_document(encrypted, "wrong-password")
+
+        # Header parameters are authenticated and bounded
+        tampered = encrypted.replace(b"p=1", b"p=2", 1)
+        with pytest.raises(Exception):
+            decrypt_document(tampered, "scrypt-password")
+        oversized = encrypted.replace(b"n=32768", b"n=1073741824", 1)
+        with pytest.raises(ValueError, match="memory limit"):
+            decrypt_document(oversized, "scrypt-password")
+
     def test_encrypted_file_roundtrip(self):
         import tempfile
         from pathlib import Path
@@ -183,6 +229,71 @@ class TestEncryption:
         enc2 = encrypt_bytes(data, "same-password")
         assert enc1 != enc2  # Different salt/nonce each time
 
+    def test_encrypt_bytes_batch(self):
+        from pfm.security import encrypt_bytes_batch, decrypt_bytes
+
+        items = [b"first", b"second", b""]
+        encrypted = encrypt_bytes_batch(items, "batch-password")
+        assert len({e[:16] for e in encrypted}) == 1  # Shared salt
+        assert len({e[16:28] for e in encrypted}) == 3  # Unique nonces
+        assert [decrypt_bytes(e, "batch-password") for e in encrypted] == items
+
+    def test_encrypt_documents_batch(self):
+        from pfm.security import encrypt_documents, decrypt_document
+
+        docs = []
+        for i in range(3):
+            doc = PFMDocument.create(agent=f"batch-{i}")
+            doc.add_section("content", f"batch content {i}")
+            docs.append(doc)
+
+        for share_salt in (False, True):
+            encrypted = encrypt_documents(docs, "batch-password", share_salt=share_salt)
+            assert len(encrypted) == 3
+            assert len(set(encrypted)) == 3
+            salts = {e[len(b"#!PFM-ENC/1.0\n"):][:16] for e in encrypted}
+            assert len(salts) == (1 if share_salt else 3)
+            for i, enc in enumerate(encrypted):
+                assert decrypt_document(enc, "batch-password").content == f"batch content {i}"
+
+
+    def test_derived_keys_are_memoized_and_bounded(self, monkeypatch):
+        import hashlib
+        from pfm import security
+        from pfm.security import clear_key_cache, decrypt_bytes, encrypt_bytes
+
+        calls = []
+
+        def fake_pbkdf2(name, password, salt, iterations, dklen):
+            calls.append(salt)
+            return hashlib.sha256(password + salt).digest()  # Fast stand-in
+
+        monkeypatch.setattr(hashlib, "pbkdf2_hmac", fake_pbkdf2)
+        clear_key_cache()
+        password = "cache-password"
+
+        first = encrypt_bytes(b"first", password)
+        assert decrypt_bytes(first, password) == b"first"
+        assert decrypt_bytes(first, password) == b"first"
+        assert len(calls) == 1  # Encrypt derived it; both decrypts hit the cache
+
+        # Fill the cache past its bound: the oldest key is evicted
+        for i in range(security._KDF_CACHE_MAX):
+            encrypt_bytes(b"filler %d" % i, password)
+        assert len(security._kdf_cache) == security._KDF_CACHE_MAX
+        assert len(calls) == 1 + security._KDF_CACHE_MAX
+        assert decrypt_bytes(first, password) == b"first"
+        assert len(calls) == 2 + security._KDF_CACHE_MAX
+
+        # Cache keys hold a keyed tag, never the password itself
+        for tag, salt, spec in security._kdf_cache:
+            assert password.encode("utf-8") not in tag + salt + spec.encode("ascii")
+
+        clear_key_cache()
+        assert not security._kdf_cache
+        decrypt_bytes(first, password)
+        assert len(calls) == 3 + security._KDF_CACHE_MAX
+
 
 class TestIntegrity:
 
@@ -231,6 +342,19 @@ class TestFingerprint:
 
         assert fingerprint(doc1) != fingerprint(doc2)
 
+    def test_fingerprint_legacy_sha256(self):
+        import hashlib
+
+        doc = PFMDocument.create()
+        doc.add_section("content", "data")
+        doc.checksum = doc.compute_checksum()
+
+        material = f"{doc.id}:{doc.checksum}:{doc.created}".encode("utf-8")
+        assert fingerprint(doc, algo="sha256") == hashlib.sha256(material).hexdigest()
+        assert fingerprint(doc) != fingerprint(doc, algo="sha256")
+        with pytest.raises(ValueError):
+            fingerprint(doc, algo="md5")
+
 
 class TestVerifyRequire:
     """Tests for verify(require=True) — fail-strict mode."""
@@ -8,14 +8,18 @@ from pathlib import Path
 import pytest
 
 from pfm.document import PFMDocument
+from pfm.reader import PFMReader
 from pfm.spells import (
     accio,
+    geminio,
+    geminio_stream,
     polyjuice,
     fidelius,
     revelio,
     prior_incantato,
     unbreakable_vow,
     vow_kept,
+    vow_kept_many,
 )
 
 
@@ -50,6 +54,12 @@ class TestAccio:
         result = accio(pfm_file, "horcrux")
         assert result is None
 
+    def test_summon_without_index(self, tmp_path):
+        path = tmp_path / "unindexed.pfm"
+        path.write_bytes(b"#!PFM/1.0\n#@meta\nagent: wizard\n#@content\nno index here\n")
+        assert accio(str(path), "content") == "no index here"
+        assert accio(str(path), "horcrux") is None
+
 
 class TestPolyjuice:
 
@@ -111,8 +121,17 @@ class TestPriorIncantato:
         assert result["agent"] == "wizard"
         assert result["model"] == "elder-wand"
         assert result["fingerprint"]
+        assert result["fingerprint_algo"] == "blake2b"
         assert result["signed"] is False
 
+    def test_unknown_integrity_without_compute(self, doc, monkeypatch):
+        monkeypatch.setattr(PFMDocument, "compute_checksum", lambda self: pytest.fail("hashed"))
+        result = prior_incantato(doc, compute=False)
+
+        assert result["integrity"] is None
+        assert result["computed_checksum"] is None
+        assert result["fingerprint"]
+
     def test_signed_document(self, doc):
         unbreakable_vow(doc, "secret")
         result = prior_incantato(doc)
@@ -133,6 +152,80 @@ class TestUnbreakableVow:
         doc.sections[0].content = "tampered by voldemort"
         assert vow_kept(doc, "expecto-patronum") is False
 
+    def test_repeated_vow_checks_see_meta_tampering(self, doc):
+        """A verified document must be re-verified in full, not served from a cache."""
+        unbreakable_vow(doc, "expecto-patronum")
+        assert vow_kept(doc, "expecto-patronum") is True
+        doc.agent = "impostor"
+        assert vow_kept(doc, "expecto-patronum") is False
+        doc.custom_meta["signature"] = "0" * 64
+        assert vow_kept(doc, "expecto-patronum") is False
+
     def test_wrong_key(self, doc):
         unbreakable_vow(doc, "expecto-patronum")
         assert vow_kept(doc, "avada-kedavra") is False
+
+    def test_vow_kept_many(self, doc, pfm_file):
+        unbreakable_vow(doc, "expecto-patronum")
+        other = PFMDocument.create(agent="muggle")
+        other.add_section("content", "no vow sworn")
+        results = vow_kept_many([doc, other, pfm_file], "expecto-patronum")
+        assert results == [True, False, False]
+
+
+class TestGeminio:
+
+    def test_stream_merge_matches_geminio(self, doc, pfm_file):
+        other = PFMDocument.create(agent="muggle", tags="owls, brooms")
+        other.add_section("content", "second part")
+        other.add_section("tools", "wand()")
+        expected = geminio(pfm_file, other)
+
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            dest = f.name
+        nbytes = geminio_stream(dest, pfm_file, other)
+        merged = PFMReader.read(dest)
+
+        assert nbytes == Path(dest).stat().st_size
+        assert merged.agent == expected.agent == "wizard"
+        assert merged.parent == expected.parent
+        assert merged.tags == expected.tags
+        assert [(s.name, s.content) for s in merged.sections] == [
+            (s.name, s.content) for s in expected.sections
+        ]
+        Path(dest).unlink()
+
+    def test_stream_merge_decodes_each_section_once(self, pfm_file, monkeypatch):
+        from pfm.reader import PFMReaderHandle
+        decoded = []
+        read_section = PFMReaderHandle._read_section
+
+        def counting_read(handle, offset, length):
+            decoded.append(offset)
+            return read_section(handle, offset, length)
+
+        monkeypatch.setattr(PFMReaderHandle, "_read_section", counting_read)
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            dest = f.name
+        geminio_stream(dest, pfm_file, pfm_file)
+
+        assert len(decoded) == 4  # content + chain, for each of the two sources
+        Path(dest).unlink()
+
+    def test_stream_merge_into_a_source(self, doc, pfm_file):
+        other = PFMDocument.create(agent="muggle")
+        other.add_section("content", "second part")
+        expected = geminio(pfm_file, other)
+
+        geminio_stream(pfm_file, pfm_file, other)
+        merged = PFMReader.read(pfm_file)
+
+        assert [(s.name, s.content) for s in merged.sections] == [
+            (s.name, s.content) for s in expected.sections
+        ]
+        assert merged.get_section("chain").content.endswith("i solemnly swear")
+        assert not list(Path(pfm_file).parent.glob("*.pfm.tmp"))
+
+    def test_stream_merge_needs_two_sources(self, pfm_file):
+        with pytest.raises(ValueError, match="at least 2"):
+            geminio_stream("unused.pfm", pfm_file)
@@ -72,6 +72,23 @@ class TestStreamWriter:
 
         Path(path).unlink()
 
+    def test_stream_indexed_access_keeps_write_order(self):
+        """Repeated section names come back from the trailing index in file order."""
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            path = f.name
+
+        with PFMStreamWriter(path) as w:
+            w.write_section("content", "first")
+            w.write_section("chain", "between")
+            w.write_section("content", "second")
+
+        with PFMReader.open(path) as reader:
+            assert reader.get_section("content") == "first"
+            assert reader.get_sections("content") == ["first", "second"]
+            assert reader.validate_checksum()
+
+        Path(path).unlink()
+
     def test_stream_multiline_content(self):
         """Multiline content should survive streaming."""
         with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
@@ -105,6 +122,28 @@ class TestStreamWriter:
         w.close()
         Path(path).unlink()
 
+    def test_stream_coalesced_writes(self):
+        """flush_each=False buffers sections until flush() or close()."""
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            path = f.name
+
+        w = PFMStreamWriter(path, agent="coalesce-test", flush_each=False)
+        w.write_section("content", "buffered section")
+        assert "buffered section" not in Path(path).read_text()
+
+        w.flush()
+        assert "buffered section" in Path(path).read_text()
+
+        w.write_section("tools", "second section")
+        w.close()
+        doc = PFMReader.read(path)
+        assert doc.content == "buffered section"
+        assert doc.get_section("tools").content == "second section"
+        with pytest.raises(RuntimeError):
+            w.flush()
+
+        Path(path).unlink()
+
     def test_stream_sections_written_count(self):
         with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
             path = f.name
@@ -219,6 +258,28 @@ class TestStreamRecovery:
 
         Path(path).unlink()
 
+    def test_append_after_crash(self):
+        """Recovering an unfinalized file keeps exact section bounds and checksum."""
+        with tempfile.NamedTemporaryFile(suffix=".pfm", delete=False) as f:
+            path = f.name
+
+        w = PFMStreamWriter(path, agent="crash-append")
+        w.write_section("content", "before the crash")
+        w.write_section("chain", "\\#@index-trailing is just text")
+        w._handle.close()
+        w._closed = True  # Simulate crash: no trailing index written
+
+        with PFMStreamWriter(path, append=True) as w:
+            w.write_section("tools", "after recovery")
+
+        with PFMReader.open(path) as reader:
+            assert reader.get_section("content") == "before the crash"
+            assert reader.get_section("chain") == "\\#@index-trailing is just text"
+            assert reader.get_section("tools") == "after recovery"
+            assert reader.validate_checksum()
+
+        Path(path).unlink()
+
 
 class TestStreamChecksum:
     """Tests for stream file checksum validation via the reader."""
@@ -29,6 +29,14 @@ class TestPFMSection:
         assert s.offset == 100
         assert s.length == 4
 
+    def test_content_bytes_cached_until_content_changes(self):
+        s = PFMSection(name="content", content="héllo")
+        encoded = s.content_bytes
+        assert encoded == "héllo".encode("utf-8")
+        assert s.content_bytes is encoded
+        s.content = "changed"
+        assert s.content_bytes == b"changed"
+
 
 # =============================================================================
 # PFMDocument
@@ -74,6 +82,51 @@ class TestPFMDocument:
         results = doc.get_sections("artifacts")
         assert len(results) == 2
 
+    def test_get_section_after_direct_list_edits(self):
+        doc = PFMDocument.create()
+        doc.add_section("content", "first")
+        doc.add_section("chain", "chain")
+
+        doc.sections.append(PFMSection(name="tools", content="appended"))
+        assert doc.get_section("tools").content == "appended"
+
+        doc.sections.reverse()
+        assert doc.get_section("content").content == "first"
+        assert [s.content for s in doc.get_sections("chain")] == ["chain"]
+
+        doc.sections = [PFMSection(name="content", content="replaced")]
+        assert doc.get_section("content").content == "replaced"
+        assert doc.get_section("chain") is None
+
+        doc.sections.append(PFMSection(name="chain", content="chain"))
+        doc.sections[1] = PFMSection(name="tools", content="swapped in")
+        assert doc.get_section("tools").content == "swapped in"
+        assert doc.get_section("chain") is None
+
+        doc.sections[1].name = "agent_log"
+        assert doc.get_section("agent_log").content == "swapped in"
+        assert doc.get_section("tools") is None
+
+        doc.sections[1] = PFMSection(name="content", content="second content")
+        assert [s.content for s in doc.get_sections("content")] == ["replaced", "second content"]
+
+    def test_get_section_after_earlier_duplicate_appears(self):
+        """An in-place edit that puts the name earlier must win over the index."""
+        doc = PFMDocument.create()
+        doc.add_section("content", "x1")
+        doc.add_section("chain", "b1")
+        assert doc.get_section("chain").content == "b1"
+
+        doc.sections[0].name = "chain"
+        assert doc.get_section("chain").content == "x1"
+        assert doc.get_section("chain") is doc.get_sections("chain")[0]
+
+        doc.sections[0] = PFMSection(name="tools", content="t1")
+        doc.sections.append(PFMSection(name="agent_log", content="log"))
+        assert doc.get_section("agent_log").content == "log"
+        doc.sections[0] = PFMSection(name="agent_log", content="earlier log")
+        assert doc.get_section("agent_log").content == "earlier log"
+
     def test_content_shortcut(self):
         doc = PFMDocument.create()
         doc.add_section("content", "the content")